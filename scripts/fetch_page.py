@@ -3,6 +3,7 @@
 
 Usage:
     uv run python scripts/fetch_page.py <URL> [--output FILE] [--wait-js EXPR]
+    uv run python scripts/fetch_page.py <URL> <URL> ... [--output DIR] [--concurrency N]
 
 This bypasses Cloudflare bot detection by running a real Chrome browser
 in headed (non-headless) mode via the nodriver library.
@@ -12,11 +13,14 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
 import shutil
 import socket
 import sys
 
 import nodriver
+import nodriver.cdp.fetch as cdp_fetch
+import nodriver.cdp.network as cdp_network
 from nodriver.core.config import temp_profile_dir
 
 
@@ -28,6 +32,15 @@ _BROWSER_CANDIDATES = [
 ]
 
 _CHALLENGE_TITLES = {"Just a moment...", ""}
+_READY_STATES_WITH_JS = ("interactive", "complete")
+
+# Resource types to block — the page source is all we keep, so images,
+# media and fonts are wasted bandwidth.
+_BLOCKED_RESOURCE_TYPES = {
+    cdp_network.ResourceType.IMAGE,
+    cdp_network.ResourceType.MEDIA,
+    cdp_network.ResourceType.FONT,
+}
 
 
 def _free_port() -> int:
@@ -51,115 +64,270 @@ async def _wait_for_port(host: str, port: int, timeout: float = 30) -> None:
     raise RuntimeError(f"Chrome debug port {host}:{port} not ready after {timeout}s")
 
 
+async def _block_heavy_resources(tab) -> None:
+    """Use CDP Fetch domain to block images, media, and fonts."""
+    async def _intercept(event: cdp_fetch.RequestPaused):
+        try:
+            if event.resource_type in _BLOCKED_RESOURCE_TYPES:
+                await tab.feed_cdp(
+                    cdp_fetch.fail_request(event.request_id, cdp_network.ErrorReason.BLOCKED_BY_CLIENT)
+                )
+            else:
+                await tab.feed_cdp(cdp_fetch.continue_request(event.request_id))
+        except Exception:
+            pass  # tab already closed
+
+    tab.add_handler(cdp_fetch.RequestPaused, _intercept)
+    await tab.feed_cdp(cdp_fetch.enable(
+        patterns=[cdp_fetch.RequestPattern(url_pattern="*")],
+    ))
+
+
 async def _wait_for_real_page(tab, wait_js: str | None = None) -> None:
+    # With a wait_js expression a parsed DOM is enough; don't also wait for
+    # late images/iframes to reach "complete".
+    ready_states = _READY_STATES_WITH_JS if wait_js else ("complete",)
     while True:
         try:
             title = str(await tab.evaluate("document.title") or "")
-            ready = str(await tab.evaluate("document.readyState") or "")
-            if title in _CHALLENGE_TITLES or ready != "complete":
+            if title in _CHALLENGE_TITLES:
                 await asyncio.sleep(0.5)
                 continue
+
+            ready = str(await tab.evaluate("document.readyState") or "")
+            if ready not in ready_states:
+                await asyncio.sleep(0.3)
+                continue
+
             if wait_js:
                 result = await tab.evaluate(wait_js)
                 if not result:
-                    await asyncio.sleep(0.5)
+                    await asyncio.sleep(0.3)
                     continue
             return
         except Exception:
             await asyncio.sleep(0.5)
 
 
-async def fetch(url: str, wait_js: str | None = None, timeout: float = 60) -> str:
-    browser_path = None
-    for name in _BROWSER_CANDIDATES:
-        path = shutil.which(name)
-        if path:
-            browser_path = path
-            break
-    if not browser_path:
-        raise FileNotFoundError("No Chrome/Chromium binary found on PATH")
-
-    host = "127.0.0.1"
-    port = _free_port()
-    user_data_dir = temp_profile_dir()
-
-    args = [
-        f"--remote-debugging-host={host}",
-        f"--remote-debugging-port={port}",
-        f"--user-data-dir={user_data_dir}",
-        "--remote-allow-origins=*",
-        "--no-first-run",
-        "--no-service-autorun",
-        "--no-default-browser-check",
-        "--homepage=about:blank",
-        "--no-pings",
-        "--password-store=basic",
-        "--disable-infobars",
-        "--disable-breakpad",
-        "--disable-dev-shm-usage",
-        "--disable-session-crashed-bubble",
-        "--disable-search-engine-choice-screen",
-        "--disable-features=IsolateOrigins,site-per-process",
-        "--no-sandbox",
-    ]
-
-    chrome_proc = await asyncio.create_subprocess_exec(
-        browser_path,
-        *args,
-        stdin=asyncio.subprocess.PIPE,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    print(f"Launched Chrome (pid {chrome_proc.pid}) on {host}:{port}", file=sys.stderr)
+class FetchSession:
+    """Keep one Chrome process and nodriver connection open across fetches.
 
-    try:
-        await _wait_for_port(host, port)
+    Launching Chrome dominates the cost of a single fetch, so callers that
+    need several pages should open a session once and call :meth:`fetch`
+    for each URL::
 
-        browser = await nodriver.Browser.create(
-            headless=False,
-            sandbox=False,
-            host=host,
-            port=port,
-            browser_executable_path=browser_path,
-        )
+        async with FetchSession() as session:
+            first = await session.fetch(url_a)
+            second = await session.fetch(url_b)
+    """
+
+    def __init__(self, block_resources: bool = True) -> None:
+        self._block_resources = block_resources
+        self._chrome_proc: asyncio.subprocess.Process | None = None
+        self._browser: nodriver.Browser | None = None
+
+    async def __aenter__(self) -> FetchSession:
+        browser_path = None
+        for name in _BROWSER_CANDIDATES:
+            path = shutil.which(name)
+            if path:
+                browser_path = path
+                break
+        if not browser_path:
+            raise FileNotFoundError("No Chrome/Chromium binary found on PATH")
 
-        tab = await browser.get(url, new_tab=True)
+        host = "127.0.0.1"
+        port = _free_port()
+        user_data_dir = temp_profile_dir()
+
+        args = [
+            f"--remote-debugging-host={host}",
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={user_data_dir}",
+            "--remote-allow-origins=*",
+            "--no-first-run",
+            "--no-service-autorun",
+            "--no-default-browser-check",
+            "--homepage=about:blank",
+            "--no-pings",
+            "--password-store=basic",
+            "--disable-infobars",
+            "--disable-breakpad",
+            "--disable-dev-shm-usage",
+            "--disable-session-crashed-bubble",
+            "--disable-search-engine-choice-screen",
+            "--disable-features=IsolateOrigins,site-per-process",
+            "--no-sandbox",
+        ]
+
+        self._chrome_proc = await asyncio.create_subprocess_exec(
+            browser_path,
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        print(
+            f"Launched Chrome (pid {self._chrome_proc.pid}) on {host}:{port}",
+            file=sys.stderr,
+        )
 
         try:
-            await asyncio.wait_for(
-                _wait_for_real_page(tab, wait_js),
-                timeout=timeout,
+            await _wait_for_port(host, port)
+
+            self._browser = await nodriver.Browser.create(
+                headless=False,
+                sandbox=False,
+                host=host,
+                port=port,
+                browser_executable_path=browser_path,
             )
-        except asyncio.TimeoutError:
-            print(f"Warning: page did not finish loading within {timeout}s", file=sys.stderr)
+        except BaseException:
+            await self._terminate_chrome()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._terminate_chrome()
 
-        content = await tab.get_content()
-        await tab.close()
-        return content
-    finally:
-        chrome_proc.terminate()
+    async def _terminate_chrome(self) -> None:
+        if self._chrome_proc is None:
+            return
+        self._chrome_proc.terminate()
         try:
-            await asyncio.wait_for(chrome_proc.wait(), timeout=5)
+            await asyncio.wait_for(self._chrome_proc.wait(), timeout=5)
         except asyncio.TimeoutError:
-            chrome_proc.kill()
+            self._chrome_proc.kill()
+        self._chrome_proc = None
+        self._browser = None
+
+    async def fetch(self, url: str, wait_js: str | None = None, timeout: float = 60) -> str:
+        """Load *url* in a new tab and return its HTML once the page is ready."""
+        if self._browser is None:
+            raise RuntimeError("FetchSession must be entered before fetching")
+
+        tab = await self._browser.get(url, new_tab=True)
+        if self._block_resources:
+            await _block_heavy_resources(tab)
+        try:
+            try:
+                await asyncio.wait_for(
+                    _wait_for_real_page(tab, wait_js),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                print(
+                    f"Warning: page did not finish loading within {timeout}s: {url}",
+                    file=sys.stderr,
+                )
+
+            return await tab.get_content()
+        finally:
+            if self._block_resources:
+                # Stop intercepting first so pending handlers don't fire
+                # on a closed tab.
+                try:
+                    await tab.feed_cdp(cdp_fetch.disable())
+                except Exception:
+                    pass
+            await tab.close()
+
+
+async def fetch(
+    url: str,
+    wait_js: str | None = None,
+    timeout: float = 60,
+    block_resources: bool = True,
+) -> str:
+    """Fetch a single page with a one-shot :class:`FetchSession`."""
+    async with FetchSession(block_resources=block_resources) as session:
+        return await session.fetch(url, wait_js=wait_js, timeout=timeout)
+
+
+async def fetch_pages(
+    urls: list[str],
+    wait_js: str | None = None,
+    timeout: float = 60,
+    concurrency: int = 4,
+    block_resources: bool = True,
+) -> list[str | BaseException]:
+    """Fetch several pages over one shared browser, *concurrency* tabs at a time.
+
+    Results are returned in the same order as *urls*.  A page that fails to
+    load is returned as its exception rather than aborting the other fetches.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async with FetchSession(block_resources=block_resources) as session:
+        async def one(url: str) -> str:
+            async with sem:
+                return await session.fetch(url, wait_js=wait_js, timeout=timeout)
+
+        return await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch a URL using nodriver (headed Chrome)")
-    parser.add_argument("url", help="URL to fetch")
-    parser.add_argument("--output", "-o", help="Write HTML to this file (default: stdout)")
+    parser.add_argument("urls", nargs="+", metavar="url", help="URL(s) to fetch")
+    parser.add_argument(
+        "--output", "-o",
+        help="Write HTML to this file, or to page_<n>.html files in this directory "
+        "when several URLs are given (default: stdout)",
+    )
     parser.add_argument("--wait-js", help="JS expression to wait for before capturing")
     parser.add_argument("--timeout", type=float, default=60, help="Page load timeout in seconds")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Maximum number of pages loading at once",
+    )
+    parser.add_argument(
+        "--no-block-resources", dest="block_resources", action="store_false",
+        help="Let the browser load images, media and fonts",
+    )
     args = parser.parse_args()
 
-    content = asyncio.run(fetch(args.url, wait_js=args.wait_js, timeout=args.timeout))
+    if len(args.urls) == 1:
+        content = asyncio.run(fetch(
+            args.urls[0],
+            wait_js=args.wait_js,
+            timeout=args.timeout,
+            block_resources=args.block_resources,
+        ))
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(content)
+            print(f"Wrote {len(content)} bytes to {args.output}", file=sys.stderr)
+        else:
+            print(content)
+        return
+
+    contents = asyncio.run(fetch_pages(
+        args.urls,
+        wait_js=args.wait_js,
+        timeout=args.timeout,
+        concurrency=max(1, args.concurrency),
+        block_resources=args.block_resources,
+    ))
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(content)
-        print(f"Wrote {len(content)} bytes to {args.output}", file=sys.stderr)
-    else:
-        print(content)
+        os.makedirs(args.output, exist_ok=True)
+    failed = 0
+    for n, (url, content) in enumerate(zip(args.urls, contents), start=1):
+        if isinstance(content, BaseException):
+            failed += 1
+            print(f"Error: failed to fetch {url}: {content!r}", file=sys.stderr)
+            continue
+        if args.output:
+            out_path = os.path.join(args.output, f"page_{n}.html")
+            with open(out_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            print(f"Wrote {len(content)} bytes to {out_path} ({url})", file=sys.stderr)
+        else:
+            print(f"<!-- {url} -->")
+            print(content)
+
+    if failed:
+        sys.exit(f"{failed} of {len(args.urls)} pages failed to load")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,13 @@ const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
 const basePath = process.env.BASE_PATH || "/";
 
+// Shared formatter for the money filters — toLocaleString() builds a new
+// NumberFormat on every call, which adds up over thousands of table cells.
+const usd = new Intl.NumberFormat("en-US");
+
+// adjClass lookup indexed by Math.sign(value) + 1
+const ADJ_CLASSES = ["adj-neg", "", "adj-pos"];
+
 export default function (eleventyConfig) {
   // Expose base path to all templates
   eleventyConfig.addGlobalData("basePath", basePath);
@@ -33,20 +40,19 @@ export default function (eleventyConfig) {
   // Nunjucks filter: format a number as $X,XXX
   eleventyConfig.addFilter("dollar", (value) => {
     if (value == null || value === "") return "";
-    return `$${Number(value).toLocaleString("en-US")}`;
+    return `$${usd.format(Number(value))}`;
   });
 
   // Nunjucks filter: format adjustment with sign and color class
   eleventyConfig.addFilter("adjustment", (value) => {
     if (value == null || value === 0) return "";
-    if (value < 0) return `-$${Math.abs(value).toLocaleString("en-US")}`;
-    return `+$${value.toLocaleString("en-US")}`;
+    return `${value < 0 ? "-" : "+"}$${usd.format(Math.abs(value))}`;
   });
 
   // Nunjucks filter: CSS class for adjustment values
   eleventyConfig.addFilter("adjClass", (value) => {
-    if (value == null || value === 0) return "";
-    return value < 0 ? "adj-neg" : "adj-pos";
+    if (value == null) return "";
+    return ADJ_CLASSES[Math.sign(value) + 1];
   });
 
   return {
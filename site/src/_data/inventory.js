@@ -12,6 +12,9 @@ import fs from "node:fs/promises";
 import path from "node:path";
 import zlib from "node:zlib";
 import { fileURLToPath } from "node:url";
+import { promisify } from "node:util";
+
+const gunzip = promisify(zlib.gunzip);
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 const INVENTORY_DIR = path.resolve(__dirname, "../../../inventory");
@@ -36,7 +39,9 @@ async function loadSnapshots() {
       const filePath = path.join(INVENTORY_DIR, entry);
       try {
         const compressed = await fs.readFile(filePath);
-        const json = zlib.gunzipSync(compressed).toString("utf-8");
+        // Async gunzip runs on the libuv threadpool, so the snapshots
+        // decompress in parallel instead of blocking the loop one by one.
+        const json = (await gunzip(compressed)).toString("utf-8");
         return { date, items: JSON.parse(json) };
       } catch (err) {
         console.warn(`[inventory data] Failed to read ${filePath}: ${err.message}`);
@@ -66,8 +71,10 @@ async function loadSnapshots() {
   // Pre-compute chart datasets so the HTML only carries minimal JSON
   const charts = buildChartData(latest, snapshots);
 
-  // Enrich each snapshot with its own trimByDealer and snapshot-level charts
+  // Enrich each snapshot with its own trimByDealer, snapshot-level charts
+  // and the price-ordered rows for the full inventory table
   for (const snap of snapshots) {
+    snap.itemsByPrice = sortByTotalPrice(snap.items);
     snap.trimByDealer = buildTrimByDealer(snap.items);
     snap.charts = buildSnapshotChartData(snap.items);
   }
@@ -75,6 +82,19 @@ async function loadSnapshots() {
   return { latest, snapshots, trimByDealer, uniqueVinCount, charts };
 }
 
+/**
+ * Return a copy of items ordered by total_price, ascending.
+ * Each item's price is read once up front instead of on every comparison;
+ * the ordering is the same as Nunjucks' `sort(false, false, "total_price")`.
+ */
+function sortByTotalPrice(items) {
+  const keys = items.map((it) => it.total_price);
+  return items
+    .map((_, i) => i)
+    .sort((i, j) => (keys[i] < keys[j] ? -1 : keys[i] > keys[j] ? 1 : 0))
+    .map((i) => items[i]);
+}
+
 /**
  * Build a pivot structure for the trim × dealer summary table.
  * Returns { dealers: [...], trims: [...], counts: { "Dealer||Trim": N, ... },
@@ -82,7 +102,9 @@ async function loadSnapshots() {
  */
 function buildTrimByDealer(items) {
   const counts = {};
-  const dealersSet = new Set();
+  // Per-dealer and per-trim tallies double as the sets of dealers / trims
+  const dealerCounts = new Map();
+  const trimCounts = new Map();
   const trimMinPrice = {};
 
   for (const item of items) {
@@ -90,7 +112,8 @@ function buildTrimByDealer(items) {
     const trim = item.trim || "Unknown";
     const key = `${dealer}||${trim}`;
     counts[key] = (counts[key] || 0) + 1;
-    dealersSet.add(dealer);
+    dealerCounts.set(dealer, (dealerCounts.get(dealer) || 0) + 1);
+    trimCounts.set(trim, (trimCounts.get(trim) || 0) + 1);
 
     const bp = item.base_price;
     if (typeof bp === "number") {
@@ -100,30 +123,19 @@ function buildTrimByDealer(items) {
     }
   }
 
-  const dealers = Array.from(dealersSet).sort();
-  const trims = Array.from(
-    new Set(Object.keys(counts).map((k) => k.split("||")[1]))
-  ).sort((a, b) => {
+  const dealers = Array.from(dealerCounts.keys()).sort();
+  const trims = Array.from(trimCounts.keys()).sort((a, b) => {
     const aHas = a in trimMinPrice ? 0 : 1;
     const bHas = b in trimMinPrice ? 0 : 1;
     if (aHas !== bHas) return aHas - bHas;
     return (trimMinPrice[a] || 0) - (trimMinPrice[b] || 0) || a.localeCompare(b);
   });
 
-  // Row and column totals
-  const dealerTotals = {};
-  const trimTotals = {};
-  let grandTotal = 0;
-
-  for (const dealer of dealers) {
-    dealerTotals[dealer] = 0;
-    for (const trim of trims) {
-      const n = counts[`${dealer}||${trim}`] || 0;
-      dealerTotals[dealer] += n;
-      trimTotals[trim] = (trimTotals[trim] || 0) + n;
-      grandTotal += n;
-    }
-  }
+  // Row and column totals, tallied in the pass above rather than by
+  // walking every dealer × trim cell
+  const dealerTotals = Object.fromEntries(dealers.map((d) => [d, dealerCounts.get(d)]));
+  const trimTotals = Object.fromEntries(trims.map((t) => [t, trimCounts.get(t)]));
+  const grandTotal = items.length;
 
   return { dealers, trims, counts, dealerTotals, trimTotals, grandTotal };
 }
@@ -29,6 +29,27 @@ export function initTableSort(tableId) {
   var curCol = -1;
   var asc = true;
 
+  // Per-column sort keys, keyed by row.  The table body is static, so each
+  // cell's attribute/text only needs to be read and parsed once.
+  var keyCache = [];
+
+  function sortKeys(rows, idx) {
+    var keys = keyCache[idx];
+    if (!keys) {
+      keys = keyCache[idx] = new Map();
+      rows.forEach(function (r) {
+        var cell = r.children[idx];
+        var sv = cell.getAttribute("data-sort-value");
+        keys.set(r, {
+          hasNum: sv !== null,
+          num: sv !== null ? parseFloat(sv) || 0 : 0,
+          text: (cell.textContent || "").trim().toLowerCase(),
+        });
+      });
+    }
+    return keys;
+  }
+
   ths.forEach(function (th, idx) {
     th.addEventListener("click", function () {
       if (curCol === idx) {
@@ -46,25 +67,26 @@ export function initTableSort(tableId) {
       th.querySelector(".sort-arrow").textContent = asc ? "\u25B2" : "\u25BC";
 
       var rows = Array.from(tbody.querySelectorAll("tr"));
+      var keys = sortKeys(rows, idx);
       rows.sort(function (a, b) {
-        var cA = a.children[idx],
-          cB = b.children[idx];
-        var sA = cA.getAttribute("data-sort-value");
-        var sB = cB.getAttribute("data-sort-value");
-        if (sA !== null && sB !== null) {
-          var nA = parseFloat(sA) || 0,
-            nB = parseFloat(sB) || 0;
-          return asc ? nA - nB : nB - nA;
+        var kA = keys.get(a),
+          kB = keys.get(b);
+        if (kA.hasNum && kB.hasNum) {
+          return asc ? kA.num - kB.num : kB.num - kA.num;
         }
-        var tA = (cA.textContent || "").trim().toLowerCase();
-        var tB = (cB.textContent || "").trim().toLowerCase();
+        var tA = kA.text,
+          tB = kB.text;
         if (tA < tB) return asc ? -1 : 1;
         if (tA > tB) return asc ? 1 : -1;
         return 0;
       });
+
+      // Re-insert through a fragment so the browser lays out once.
+      var frag = document.createDocumentFragment();
       rows.forEach(function (r) {
-        tbody.appendChild(r);
+        frag.appendChild(r);
       });
+      tbody.appendChild(frag);
     });
   });
 }
@@ -288,6 +288,11 @@ class NoDriverHandler(HTTP11DownloadHandler):
     # Known loading/challenge page titles to wait past.
     _CHALLENGE_TITLES = {"Just a moment...", ""}
 
+    # Acceptable ``document.readyState`` values when the spider supplies
+    # its own readiness expression — a parsed DOM is enough to extract
+    # HTML from, so don't wait for late images/iframes to finish.
+    _READY_STATES_WITH_JS = ("interactive", "complete")
+
     @staticmethod
     async def _wait_for_real_page(
         tab: nodriver.Tab,
@@ -297,9 +302,11 @@ class NoDriverHandler(HTTP11DownloadHandler):
 
         Checks three conditions in a loop:
         1. Title is not a known challenge/loading page title.
-        2. ``document.readyState`` is ``"complete"``.
+        2. ``document.readyState`` is ``"complete"`` (or ``"interactive"``
+           when *wait_js* is given).
         3. If *wait_js* is given, that expression evaluates to truthy.
         """
+        ready_states = NoDriverHandler._READY_STATES_WITH_JS if wait_js else ("complete",)
         while True:
             try:
                 title = str(await tab.evaluate("document.title") or "")
@@ -308,7 +315,7 @@ class NoDriverHandler(HTTP11DownloadHandler):
                     continue
 
                 ready = str(await tab.evaluate("document.readyState") or "")
-                if ready != "complete":
+                if ready not in ready_states:
                     await asyncio.sleep(0.3)
                     continue
 
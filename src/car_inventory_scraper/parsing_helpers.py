@@ -7,6 +7,7 @@ duplication and ensuring consistent behaviour.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 
@@ -17,6 +18,9 @@ from scrapy.http import HtmlResponse
 # Pricing helpers
 # ---------------------------------------------------------------------------
 
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+
+
 def parse_price(s) -> int | None:
     """Extract integer price from a string like ``$48,714`` or ``48714``.
 
@@ -24,7 +28,14 @@ def parse_price(s) -> int | None:
     """
     if not s:
         return None
-    digits = re.sub(r"[^\d]", "", str(s))
+    return _parse_price_str(s if isinstance(s, str) else str(s))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_price_str(s: str) -> int | None:
+    """Memoised core of :func:`parse_price` — MSRPs and package prices
+    repeat heavily across an inventory."""
+    digits = _NON_DIGIT_RE.sub("", s)
     return int(digits) if digits and int(digits) != 0 else None
 
 
@@ -59,17 +70,18 @@ def normalize_pkg_name(name: str) -> str:
 
 
 # Packages to exclude from scraped results — these are free and/or legally
-# required, so they aren't meaningful pricing add-ons.
-EXCLUDED_PACKAGES: frozenset[str] = frozenset({
+# required, so they aren't meaningful pricing add-ons.  Stored casefolded;
+# compare against ``normalize_pkg_name(name).casefold()``.
+EXCLUDED_PACKAGES: frozenset[str] = frozenset(name.casefold() for name in (
     "50 state emissions",
     "owner's portfolio",
-})
+))
 
-# Package names (normalised to lowercase) that are dealer-installed
+# Package names (normalised and casefolded) that are dealer-installed
 # accessories rather than factory packages.  These are moved from the
 # ``packages`` list into ``dealer_accessories`` by the
 # ``PackageFilterPipeline`` and counted under ``dealer_accessories_price``.
-DEALER_ACCESSORY_NAMES: frozenset[str] = frozenset({
+DEALER_ACCESSORY_NAMES: frozenset[str] = frozenset(name.casefold() for name in (
     "pulse",
     "perma plate appearance protection 5yrs coverage",
     "permaplate appearance protection 5yrs coverage",
@@ -82,7 +94,26 @@ DEALER_ACCESSORY_NAMES: frozenset[str] = frozenset({
     "z360shield -paintshield and interiorshield",
     "max shield",
     "maximum shield- complete vehicle protection",
-})
+))
+
+
+# ---------------------------------------------------------------------------
+# Inline-script variable lookup
+# ---------------------------------------------------------------------------
+
+def search_from_marker(pattern: re.Pattern, text: str, marker: str) -> re.Match | None:
+    """Search *text* with *pattern*, starting just before the first *marker*.
+
+    SRPs are often several hundred KB of HTML while each JS variable
+    sits in one ``<script>``; a ``str.find`` for the variable name is far
+    cheaper than letting the regex scan everything up to it, and pages
+    without the marker are rejected without running the regex at all.
+    """
+    idx = text.find(marker)
+    if idx == -1:
+        return None
+    # Back up over the ``var`` keyword and whitespace preceding the name.
+    return pattern.search(text, max(idx - 64, 0))
 
 
 # ---------------------------------------------------------------------------
@@ -149,6 +180,7 @@ _DRIVETRAIN_MAP: dict[str, str] = {
 _DRIVETRAIN_TOKENS = ("AWD", "4WD", "FWD", "RWD", "4X4", "4X2")
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_drivetrain(*sources: str) -> str | None:
     """Normalise a drivetrain string to a short token (AWD, FWD, …).
 
@@ -156,7 +188,8 @@ def normalize_drivetrain(*sources: str) -> str | None:
     body style).  Tries an exact map lookup first, then falls back to
     scanning for known verbose names and short tokens.
 
-    Returns ``None`` if no drivetrain can be determined.
+    Returns ``None`` if no drivetrain can be determined.  Memoised, as
+    the same few source strings recur throughout a crawl.
     """
     for raw in sources:
         if not raw:
@@ -181,17 +214,23 @@ def normalize_drivetrain(*sources: str) -> str | None:
 # Color normalisation
 # ---------------------------------------------------------------------------
 
+_BRACKETED_RE = re.compile(r"\[.*?\]")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_color(raw: str | None) -> str | None:
     """Clean up a color string.
 
     Removes bracketed substrings (e.g. ``[extra]``), registered-trademark
-    symbols, and excess whitespace.
+    symbols, and excess whitespace.  Memoised, as a handful of colors
+    cover most of an inventory.
     """
     if not raw:
         return None
-    cleaned = re.sub(r"\[.*?\]", "", raw)
+    cleaned = _BRACKETED_RE.sub("", raw)
     cleaned = cleaned.replace("&#xAE;", "")
     cleaned = cleaned.replace("\xae", "")
     cleaned = cleaned.replace("®", "")
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = _MULTI_SPACE_RE.sub(" ", cleaned).strip()
     return cleaned or None
@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 from pathlib import Path
 
+from car_inventory_scraper.parsing_helpers import (
+    _NON_DIGIT_RE,
+    DEALER_ACCESSORY_NAMES,
+    EXCLUDED_PACKAGES,
+    normalize_pkg_name,
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _package_key(name: str) -> str:
+    """Return the normalised, casefolded form of a package name.
+
+    The same handful of package names repeat on nearly every vehicle of a
+    crawl, so the result is memoised.
+    """
+    return normalize_pkg_name(name).casefold()
+
 
 class CleanTextPipeline:
     """Strip whitespace and normalise text fields."""
@@ -39,7 +59,7 @@ class CleanTextPipeline:
             value = item.get(field)
             if isinstance(value, str):
                 # collapse whitespace and strip
-                item[field] = re.sub(r"\s+", " ", value).strip()
+                item[field] = _WHITESPACE_RE.sub(" ", value).strip()
 
         # Normalise drivetrain values
         dt = item.get("drivetrain")
@@ -55,14 +75,14 @@ class CleanTextPipeline:
         for price_field in ("msrp", "base_price", "total_packages_price", "dealer_accessories_price", "total_price"):
             raw = item.get(price_field)
             if isinstance(raw, str):
-                digits = re.sub(r"[^\d]", "", raw)
+                digits = _NON_DIGIT_RE.sub("", raw)
                 item[price_field] = int(digits) if digits else None
 
         # adjustments can be negative
         adj = item.get("adjustments")
         if isinstance(adj, str):
             negative = "-" in adj
-            digits = re.sub(r"[^\d]", "", adj)
+            digits = _NON_DIGIT_RE.sub("", adj)
             if digits:
                 item["adjustments"] = -int(digits) if negative else int(digits)
             else:
@@ -83,12 +103,6 @@ class PackageFilterPipeline:
     """
 
     def process_item(self, item, spider):
-        from car_inventory_scraper.parsing_helpers import (
-            DEALER_ACCESSORY_NAMES,
-            EXCLUDED_PACKAGES,
-            normalize_pkg_name,
-        )
-
         raw_packages = item.get("packages") or []
         if not raw_packages:
             return item
@@ -97,7 +111,7 @@ class PackageFilterPipeline:
         dealer_acc: list[dict] = list(item.get("dealer_accessories") or [])
 
         for pkg in raw_packages:
-            name = normalize_pkg_name(pkg.get("name", "")).lower()
+            name = _package_key(pkg.get("name", ""))
             if name in EXCLUDED_PACKAGES:
                 continue
             if name in DEALER_ACCESSORY_NAMES:
@@ -229,10 +243,10 @@ class JsonReportPipeline:
         # nested arrays so diffs stay minimal across runs.
         items = [self._normalise(item) for item in items]
 
-        Path(self.output_path).write_text(
-            json.dumps(items, indent=2, sort_keys=True, default=str),
-            encoding="utf-8",
-        )
+        # Stream the encoder's chunks straight into the file rather than
+        # building the whole (multi-megabyte) document as one string.
+        with Path(self.output_path).open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(items, f, indent=2, sort_keys=True, default=str)
         self.logger.info(
             "JSON report written to %s (%d vehicles)",
             self.output_path,
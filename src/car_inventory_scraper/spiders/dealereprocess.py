@@ -8,6 +8,8 @@ attribute with URL-encoded JSON metadata.
 
 Cloudflare protection is bypassed via the ``nodriver`` request
 meta key (using the ``nodriver`` library with a real Chrome browser).
+Search pages always use the browser; detail pages are tried over plain
+HTTP first and only fall back to the browser if that is blocked.
 
 Example usage::
 
@@ -19,12 +21,21 @@ from __future__ import annotations
 
 import json
 import re
-from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+import sys
+from urllib.parse import (
+    unquote_to_bytes,
+    urljoin,
+    urlsplit,
+    urlunsplit,
+)
 
 import scrapy
+from parsel import css2xpath
+from w3lib.url import canonicalize_url
 
 from car_inventory_scraper.spiders import log_request_failure
-from scrapy.http import HtmlResponse
+from scrapy.http import HtmlResponse, TextResponse
+from scrapy.spidermiddlewares.httperror import HttpError
 
 from car_inventory_scraper.items import CarItem
 from car_inventory_scraper.parsing_helpers import (
@@ -35,11 +46,47 @@ from car_inventory_scraper.parsing_helpers import (
 )
 
 
+# Browser readiness check for VDPs — the JSON-LD block carries the core data.
+_VDP_WAIT_JS = "document.querySelector('script[type=\"application/ld+json\"]')"
+
+# Downloader slot for VDPs fetched over plain HTTP.
+_PLAIN_VDP_SLOT = "dealereprocess-vdp"
+
+# <title>s of Cloudflare's interstitial challenge / block pages.
+_CF_CHALLENGE_TITLES = {"Just a moment...", "Attention Required! | Cloudflare"}
+
+# CSS selectors, translated to XPath once at import rather than on every
+# ``.css()`` call.
+_TITLE_XPATH = css2xpath("title::text")
+_VEHICLE_CARD_XPATH = css2xpath(".vehicle_item")
+_VEHICLE_LINK_XPATH = css2xpath(".vehicle_item__vehicle_link::attr(href)")
+_VEHICLE_TITLE_XPATH = css2xpath(".vehicle_item__title::text")
+_INSTALLED_OPT_XPATH = css2xpath(".installed_options__item")
+_INSTALLED_OPT_TITLE_XPATH = css2xpath(".installed_options__title::text")
+_INSTALLED_OPT_COST_XPATH = css2xpath(".installed_options__cost::text")
+_JSON_LD_XPATH = css2xpath('script[type="application/ld+json"]::text')
+_PRICING_DT_XPATH = css2xpath(".veh_pricing_container dl dt")
+# Text nodes of every ``.intransit`` badge (and their children) — a page can
+# carry separate "Sale Pending" and "In Transit" badges.
+_INTRANSIT_TEXT_XPATH = css2xpath(".intransit") + "//text()"
+_PAGINATION_INPUT_XPATH = css2xpath(".srp_pagination_links_container input")
+_PAGINATION_SCRIPT_XPATH = css2xpath(".srp_pagination_links_container script::text")
+
+
 class DealerEprocessSpider(scrapy.Spider):
     """Scrape vehicle inventory from a Dealer eProcess-powered dealership site."""
 
     name = "dealereprocess"
 
+    # Plain-HTTP VDP fetches get their own downloader slot so a couple
+    # can be in flight at once; SRPs and browser-rendered VDPs stay on
+    # the dealer's default slot under the global politeness settings.
+    custom_settings = {
+        "DOWNLOAD_SLOTS": {
+            _PLAIN_VDP_SLOT: {"concurrency": 2, "delay": 1},
+        },
+    }
+
     # Passed via ``-a url=…`` or the CLI wrapper.
     def __init__(self, url: str | None = None, dealer_name: str | None = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -50,7 +97,15 @@ class DealerEprocessSpider(scrapy.Spider):
             )
         self.start_url = url
         self._dealer_name_override = dealer_name
-        self._domain = urlparse(url).netloc
+        # Dealer name parsed from the first SRP's <title>; every later
+        # page of the same search carries the same title.
+        self._dealer_name_cache: str | None = None
+        self._domain = urlsplit(url).netloc
+
+        # VDPs are server-rendered, so try them over plain HTTP first.
+        # Flips to True the first time a plain fetch hits a Cloudflare
+        # challenge, after which every VDP goes through Chrome.
+        self._vdp_needs_browser = False
 
     # ------------------------------------------------------------------
     # Search results page — collect detail links
@@ -67,37 +122,21 @@ class DealerEprocessSpider(scrapy.Spider):
     async def parse_search(self, response: HtmlResponse):
         """Parse the search results page and follow each vehicle detail link."""
         base_url = response.url
-        dealer_name = (
-            self._dealer_name_override
-            or response.css("title::text").get("").split(" - ")[-1].strip()
-        )
+        split = urlsplit(base_url)
+        origin = f"{split.scheme}://{split.netloc}"
+        dealer_name = self._dealer_name_override or self._dealer_name_cache
+        if not dealer_name:
+            dealer_name = response.xpath(_TITLE_XPATH).get("").split(" - ")[-1].strip()
+            self._dealer_name_cache = dealer_name
 
         # Collect detail-page URLs from vehicle cards
-        vehicle_cards = response.css(".vehicle_item")
+        vehicle_cards = response.xpath(_VEHICLE_CARD_XPATH)
         self.logger.info("[%s] Found %d vehicles on %s", self._domain, len(vehicle_cards), response.url)
 
-        for card in vehicle_cards:
-            # Primary: dedicated vehicle link element
-            href = card.css(".vehicle_item__vehicle_link::attr(href)").get("")
-            if not href:
-                self.logger.warning("[%s] No vehicle link found in card: %s", self._domain, card.css(".vehicle_item__title::text").get(""))
-                continue
-
-            detail_url = urljoin(base_url, href)
-
-            yield scrapy.Request(
-                detail_url,
-                meta={
-                    "nodriver": True,
-                    "nodriver_wait_js": "document.querySelector('script[type=\"application/ld+json\"]')",
-                    "dealer_name": dealer_name,
-                    "dealer_url": base_url,
-                },
-                callback=self.parse_detail,
-                errback=self.errback,
-            )
-
         # --- Pagination ---
+        # Queue the next SRP ahead of this page's VDPs so the (slow,
+        # browser-rendered) search chain stays in flight while details
+        # are fetched.
         next_url = _build_next_page_url(response)
         if next_url:
             yield scrapy.Request(
@@ -105,6 +144,27 @@ class DealerEprocessSpider(scrapy.Spider):
                 meta={"nodriver": True, "nodriver_wait_js": "document.querySelector('.vehicle_item')"},
                 callback=self.parse_search,
                 errback=self.errback,
+                priority=1,
+            )
+
+        seen = set()
+        for card in vehicle_cards:
+            # Primary: dedicated vehicle link element
+            href = card.xpath(_VEHICLE_LINK_XPATH).get("")
+            if not href:
+                self.logger.warning("[%s] No vehicle link found in card: %s", self._domain, card.xpath(_VEHICLE_TITLE_XPATH).get(""))
+                continue
+
+            # DEP decorates links with query params in varying order —
+            # canonicalise so the same VDP isn't requested twice.
+            detail_url = canonicalize_url(_absolute_link_url(base_url, origin, href))
+            if detail_url in seen:
+                continue
+            seen.add(detail_url)
+
+            yield self._detail_request(
+                detail_url,
+                {"dealer_name": dealer_name, "dealer_url": base_url},
             )
 
     # ------------------------------------------------------------------
@@ -125,77 +185,187 @@ class DealerEprocessSpider(scrapy.Spider):
            installed options (``.installed_options__item``), stock/VIN
            (``.bolded_label_value``), and the page title.
         """
-        item = CarItem()
-        item["detail_url"] = response.url
-        item["dealer_name"] = response.meta.get("dealer_name", "")
-        item["dealer_url"] = response.meta.get("dealer_url", "")
-
         # --- JSON-LD Vehicle data ---
         json_ld = _extract_json_ld_vehicle(response)
+        if not json_ld and not response.meta.get("nodriver"):
+            yield self._browser_fallback(
+                response.request, blocked=_is_cloudflare_block(response),
+            )
+            return
 
         # --- data-vehicle JSON ---
         data_vehicle = _extract_data_vehicle(response)
 
-        # --- Core vehicle info ---
-        item["vin"] = json_ld.get("vehicleIdentificationNumber")
-        item["stock_number"] = json_ld.get("sku") or None
-        item["model_code"] = data_vehicle.get("modelCd") or None
-        item["year"] = json_ld.get("vehicleModelDate") or None
-        item["trim"] = json_ld.get("vehicleConfiguration") or None
-
-        # --- Colors ---
-        item["exterior_color"] = normalize_color(json_ld.get("color"))
-        item["interior_color"] = normalize_color(json_ld.get("vehicleInteriorColor"))
-
-        # --- Drivetrain ---
-        # DEP stores drivetrain in the name field rather than
-        # a dedicated JSON-LD property.
-        name = json_ld.get("name", "")
-        item["drivetrain"] = normalize_drivetrain(name)
-
         # --- Packages / installed options ---
         packages = []
-        for opt in response.css(".installed_options__item"):
-            opt_name = opt.css(".installed_options__title::text").get("").strip()
-            opt_price_raw = opt.css(".installed_options__cost::text").get("").strip()
+        for opt in response.xpath(_INSTALLED_OPT_XPATH):
+            opt_name = opt.xpath(_INSTALLED_OPT_TITLE_XPATH).get("").strip()
+            opt_price_raw = opt.xpath(_INSTALLED_OPT_COST_XPATH).get("").strip()
             if not opt_name:
                 continue
-            packages.append({"name": normalize_pkg_name(opt_name), "price": parse_price(opt_price_raw)})
-        item["packages"] = packages or None
+            packages.append({
+                "name": _intern(normalize_pkg_name(opt_name)),
+                "price": parse_price(opt_price_raw),
+            })
 
         # --- Pricing ---
+        prices = _collect_pricing(response)
+
         # TSRP / MSRP from the pricing container
-        msrp = _extract_pricing_label(response, "TSRP") or None
-        item["msrp"] = msrp
+        msrp = _pricing_label_value(prices, "TSRP") or None
 
         # Total / advertised price — look for an advertised price label first, then fall back to MSRP.
-        total_price = _extract_pricing_label(response, "ADVERTISED PRICE")
-        item["total_price"] = total_price if total_price else msrp
+        total_price = _pricing_label_value(prices, "ADVERTISED PRICE")
+
+        # --- Status / availability date (both read the .intransit badge) ---
+        intransit_text = _extract_intransit_text(response)
+
+        # Build the item in one constructor call rather than ~18
+        # separate field assignments.
+        yield CarItem(
+            detail_url=response.url,
+            dealer_name=response.meta.get("dealer_name", ""),
+            dealer_url=response.meta.get("dealer_url", ""),
+            # Core vehicle info
+            vin=json_ld.get("vehicleIdentificationNumber"),
+            stock_number=json_ld.get("sku") or None,
+            model_code=_intern(data_vehicle.get("modelCd") or None),
+            year=json_ld.get("vehicleModelDate") or None,
+            trim=_intern(json_ld.get("vehicleConfiguration") or None),
+            # Colors
+            exterior_color=_intern(normalize_color(json_ld.get("color"))),
+            interior_color=_intern(normalize_color(json_ld.get("vehicleInteriorColor"))),
+            # DEP stores drivetrain in the name field rather than
+            # a dedicated JSON-LD property.
+            drivetrain=normalize_drivetrain(json_ld.get("name", "")),
+            packages=packages or None,
+            msrp=msrp,
+            total_price=total_price if total_price else msrp,
+            status=_intern(_extract_status(intransit_text, json_ld)),
+            availability_date=_extract_availability_date(intransit_text),
+        )
 
-        # --- Status ---
-        item["status"] = _extract_status(response, json_ld)
+    # ------------------------------------------------------------------
+    # Detail request builders — plain HTTP first, browser as fallback
+    # ------------------------------------------------------------------
 
-        # --- Availability date ---
-        item["availability_date"] = _extract_availability_date(response)
+    def _detail_request(self, detail_url: str, meta: dict) -> scrapy.Request:
+        """Build a VDP request, skipping the browser while plain HTTP works."""
+        meta = dict(meta)
+        if self._vdp_needs_browser:
+            meta["nodriver"] = True
+            meta["nodriver_wait_js"] = _VDP_WAIT_JS
+        else:
+            meta["download_slot"] = _PLAIN_VDP_SLOT
+        return scrapy.Request(
+            detail_url,
+            meta=meta,
+            callback=self.parse_detail,
+            errback=self.errback_detail,
+        )
+
+    def _browser_fallback(self, request: scrapy.Request, blocked: bool = False) -> scrapy.Request:
+        """Re-issue a plain-HTTP VDP request through the browser.
 
-        yield item
+        Only a *blocked* fetch switches the remaining VDPs over to nodriver;
+        anything else re-issues just this one request.
+        """
+        if blocked and not self._vdp_needs_browser:
+            self.logger.info(
+                "[%s] VDPs need a browser — switching to nodriver for detail pages",
+                self._domain,
+            )
+            self._vdp_needs_browser = True
+        return scrapy.Request(
+            request.url,
+            meta={
+                "nodriver": True,
+                "nodriver_wait_js": _VDP_WAIT_JS,
+                "dealer_name": request.meta.get("dealer_name", ""),
+                "dealer_url": request.meta.get("dealer_url", ""),
+            },
+            callback=self.parse_detail,
+            errback=self.errback,
+            dont_filter=True,
+        )
 
     # ------------------------------------------------------------------
-    # Error handler
+    # Error handlers
     # ------------------------------------------------------------------
 
     async def errback(self, failure):
         log_request_failure(failure, self._domain, self.logger)
 
+    def errback_detail(self, failure):
+        """Re-issue a plain-HTTP VDP fetch via nodriver if Cloudflare blocked it."""
+        if not failure.request.meta.get("nodriver") and failure.check(HttpError):
+            response = failure.value.response
+            if _is_cloudflare_block(response):
+                yield self._browser_fallback(failure.request, blocked=True)
+                return
+        log_request_failure(failure, self._domain, self.logger)
+
+
+# ---------------------------------------------------------------------------
+# Helpers — bot protection
+# ---------------------------------------------------------------------------
+
+def _is_cloudflare_block(response) -> bool:
+    """Return True if *response* is a Cloudflare challenge / block page."""
+    if response.headers.get("cf-mitigated"):
+        return True
+    if response.status not in (403, 503) or not isinstance(response, TextResponse):
+        return False
+    title = response.xpath(_TITLE_XPATH).get("").strip()
+    return title in _CF_CHALLENGE_TITLES
+
+
+# ---------------------------------------------------------------------------
+# Helpers — URLs
+# ---------------------------------------------------------------------------
+
+def _absolute_link_url(base_url: str, origin: str, href: str) -> str:
+    """Resolve *href* against the SRP URL without a full ``urljoin``.
+
+    DEP card links are almost always absolute or site-root-relative, so
+    those are handled with a prefix check (*origin* is the SRP's
+    ``scheme://netloc``); anything else falls back to ``urljoin``.
+    """
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/") and not href.startswith("//"):
+        return origin + href
+    return urljoin(base_url, href)
+
+
+# ---------------------------------------------------------------------------
+# Helpers — strings
+# ---------------------------------------------------------------------------
+
+def _intern(value):
+    """Intern *value* if it is a string.
+
+    Trims, colors, model codes and package names repeat across nearly
+    every VDP of a dealer, so interning lets all items share one object
+    per distinct value instead of holding a fresh copy each.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 # ---------------------------------------------------------------------------
 # Helpers — JSON-LD
 # ---------------------------------------------------------------------------
 
+_VEHICLE_TYPES = frozenset({"Vehicle", "Car"})
+
+
 def _extract_json_ld_vehicle(response: HtmlResponse) -> dict:
     """Return the first JSON-LD block with ``@type`` of ``Vehicle`` or ``Car``, or ``{}``."""
-    _VEHICLE_TYPES = {"Vehicle", "Car"}
-    for script in response.css('script[type="application/ld+json"]::text').getall():
+    for script in response.xpath(_JSON_LD_XPATH).getall():
+        # VDPs also carry Organization/BreadcrumbList/WebSite blocks —
+        # skip decoding any that can't contain a vehicle type.
+        if '"Vehicle"' not in script and '"Car"' not in script:
+            continue
         try:
             data = json.loads(script)
         except (json.JSONDecodeError, TypeError):
@@ -219,14 +389,14 @@ def _extract_json_ld_vehicle(response: HtmlResponse) -> dict:
 
 def _extract_data_vehicle(response: HtmlResponse) -> dict:
     """Decode the first ``data-vehicle`` URL-encoded JSON attribute on the page."""
-    import urllib.parse
-
-    raw = response.css("[data-vehicle]::attr(data-vehicle)").get("")
+    raw = response.xpath("//*[@data-vehicle]/@data-vehicle").get("")
     if not raw:
         return {}
     try:
-        return json.loads(urllib.parse.unquote(raw))
-    except (json.JSONDecodeError, TypeError):
+        # Skip the percent-decoding scan when the JSON was stored unencoded;
+        # otherwise json.loads takes the UTF-8 bytes directly.
+        return json.loads(unquote_to_bytes(raw) if "%" in raw else raw)
+    except (ValueError, TypeError):
         return {}
 
 
@@ -234,8 +404,8 @@ def _extract_data_vehicle(response: HtmlResponse) -> dict:
 # Helpers — pricing
 # ---------------------------------------------------------------------------
 
-def _extract_pricing_label(response: HtmlResponse, label: str) -> int | None:
-    """Extract a price value from the pricing container by its ``<dt>`` label.
+def _collect_pricing(response: HtmlResponse) -> dict[str, str]:
+    """Map each ``<dt>`` label in the pricing container to its ``<dd>`` text.
 
     DEP VDPs display pricing as a single ``<dl>`` with paired ``<dt>``/``<dd>``
     elements inside ``.veh_pricing_container``::
@@ -246,13 +416,30 @@ def _extract_pricing_label(response: HtmlResponse, label: str) -> int | None:
           <dt>ADVERTISED PRICE</dt>
           <dd>$44,200</dd>
         </dl>
+
+    Labels are upper-cased; the first occurrence of a label wins.  The
+    container is walked once so every price on the page can be looked up
+    with :func:`_pricing_label_value`.
     """
-    for dt in response.css(".veh_pricing_container dl dt"):
-        dt_text = dt.css("::text").get("").strip().upper()
-        if dt_text.startswith(label.upper()):
-            dd = dt.xpath("following-sibling::dd[1]")
-            dd_text = dd.css("::text").get("").strip()
-            return parse_price(dd_text)
+    prices: dict[str, str] = {}
+    for dt in response.xpath(_PRICING_DT_XPATH):
+        # Read the first text node straight off the lxml elements rather
+        # than building a Selector per <dt>/<dd>.
+        dt_el = dt.root
+        label = next(dt_el.itertext(), "").strip().upper()
+        if label in prices:
+            continue
+        dd_el = next(dt_el.itersiblings("dd"), None)
+        prices[label] = "" if dd_el is None else next(dd_el.itertext(), "").strip()
+    return prices
+
+
+def _pricing_label_value(prices: dict[str, str], label: str) -> int | None:
+    """Return the price for the first label in *prices* starting with *label*."""
+    label = label.upper()
+    for key, value in prices.items():
+        if key.startswith(label):
+            return parse_price(value)
     return None
 
 
@@ -260,54 +447,70 @@ def _extract_pricing_label(response: HtmlResponse, label: str) -> int | None:
 # Helpers — status
 # ---------------------------------------------------------------------------
 
-def _extract_status(response: HtmlResponse, json_ld: dict) -> str:
-    """Determine vehicle availability status.
+def _extract_intransit_text(response: HtmlResponse) -> str:
+    """Return the lowercased text of the ``.intransit`` badges, or ``""``.
+
+    DEP uses ``.intransit`` elements for status badges, and the estimated
+    arrival date may sit in a child ``<span>``.  The text nodes of every
+    badge are space-joined and whitespace-normalised once, then shared
+    by the status and date helpers.
+    """
+    text = " ".join(response.xpath(_INTRANSIT_TEXT_XPATH).getall())
+    return " ".join(text.split()).lower()
+
+
+_STATUS_PHRASE_RE = re.compile(
+    r"(?P<sale_pending>sale pending)"
+    r"|(?P<in_production>build phase|in production)"
+    r"|(?P<in_transit>in transit)"
+)
+
+
+def _extract_status(intransit_text: str, json_ld: dict) -> str:
+    """Determine vehicle availability status from the ``.intransit`` text.
 
-    Checks for the ``.intransit`` CSS class (used by DEP for status badges).
     Returns a status string like ``"In Stock"``, ``"In Transit"``,
     ``"In Production"``, optionally prefixed with ``"Sale Pending - "``.
+    An empty *intransit_text* (no badge) means in stock.
     """
-    intransit_el = response.css(".intransit")
-    if intransit_el:
-        text = " ".join(
-            t.strip() for t in intransit_el.css("*::text").getall() if t.strip()
-        ).lower()
-
-        sale_pending = "sale pending" in text
-
-        if "build phase" in text or "in production" in text:
-            status = "In Production"
-        elif "in transit" in text:
-            status = "In Transit"
+    if not intransit_text:
+        return "In Stock"
+
+    # Scan the badge text once, noting which phrases appear.
+    sale_pending = in_production = in_transit = False
+    for m in _STATUS_PHRASE_RE.finditer(intransit_text):
+        if m.lastgroup == "sale_pending":
+            sale_pending = True
+        elif m.lastgroup == "in_production":
+            in_production = True
         else:
-            status = "In Stock"
+            in_transit = True
 
-        if sale_pending:
-            return f"Sale Pending - {status}"
-        return status
+    if in_production:
+        status = "In Production"
+    elif in_transit:
+        status = "In Transit"
+    else:
+        status = "In Stock"
 
-    return "In Stock"
+    if sale_pending:
+        return f"Sale Pending - {status}"
+    return status
 
 
 # ---------------------------------------------------------------------------
 # Helpers — availability date
 # ---------------------------------------------------------------------------
 
-_AVAIL_DATE_RE = re.compile(
-    r"(?:estimated\s+)?(?:arrival|availability)\s+(\d{1,2}/\d{1,2}/\d{2,4})",
-    re.IGNORECASE,
-)
+# Matched against the already-lowercased badge text, so no IGNORECASE.
+# ``\s*`` before the date keeps the match tolerant of however the label
+# and date are spaced in the badge markup.
+_AVAIL_DATE_RE = re.compile(r"(?:arrival|availability)\s*(\d{1,2}/\d{1,2}/\d{2,4})")
 
 
-def _extract_availability_date(response: HtmlResponse) -> str | None:
-    """Extract an estimated arrival / availability date from the page text."""
-    # Collect all descendant text — the date may be inside a child <span>.
-    text = " ".join(
-        t.strip()
-        for t in response.css(".intransit *::text").getall()
-        if t.strip()
-    )
-    match = _AVAIL_DATE_RE.search(text)
+def _extract_availability_date(intransit_text: str) -> str | None:
+    """Extract an estimated arrival / availability date from the ``.intransit`` text."""
+    match = _AVAIL_DATE_RE.search(intransit_text)
     if match:
         return match.group(1)
     return None
@@ -317,35 +520,64 @@ def _extract_availability_date(response: HtmlResponse) -> str | None:
 # Helpers — pagination
 # ---------------------------------------------------------------------------
 
+_CURRENT_PAGE_RE = re.compile(r"var\s+current_page\s*=\s*(\d+)")
+_PAGE_COUNT_RE = re.compile(r"var\s+page_count\s*=\s*(\d+)")
+_P_PARAM_RE = re.compile(r"(^|&)p=[^&]*")
+
+
 def _build_next_page_url(response: HtmlResponse) -> str | None:
     """Build the URL for the next SRP page, or return *None* on the last page.
 
     DEP uses a JavaScript-driven pagination widget with an ``<input>``
     field and left/right arrow buttons.  The page number is passed as
     the ``p`` query-string parameter.  This helper reads the current
-    page and total pages from the embedded script to determine whether
+    page and total pages from the widget's ``<input>`` attributes when
+    present, falling back to the embedded script, to determine whether
     a next page exists.
     """
-    # Extract current page and total pages from the inline pagination script.
+    current_page, page_count = (
+        _pagination_from_input(response) or _pagination_from_script(response)
+    )
+
+    if current_page >= page_count:
+        return None
+
+    # Build next page URL by setting p=<next> directly in the raw query
+    # string, which also leaves special chars in other param names
+    # (e.g. "s:pr") unencoded as the DEP site expects.
+    split = urlsplit(response.url)
+    page_param = f"p={current_page + 1}"
+    new_query, replaced = _P_PARAM_RE.subn(rf"\g<1>{page_param}", split.query, count=1)
+    if not replaced:
+        new_query = f"{split.query}&{page_param}" if split.query else page_param
+    return urlunsplit((split.scheme, split.netloc, split.path, new_query, split.fragment))
+
+
+def _pagination_from_input(response: HtmlResponse) -> tuple[int, int] | None:
+    """Read ``(current_page, page_count)`` from the pagination ``<input>``.
+
+    Newer DEP sites carry the current page as the input's ``value`` and
+    the page count as ``data-total``.  Returns ``None`` if either is
+    missing so the caller can fall back to the inline script.
+    """
+    page_input = response.xpath(_PAGINATION_INPUT_XPATH)
+    try:
+        return int(page_input.attrib["value"]), int(page_input.attrib["data-total"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _pagination_from_script(response: HtmlResponse) -> tuple[int, int]:
+    """Read ``(current_page, page_count)`` from the inline pagination script."""
     current_page = 1
     page_count = 1
 
-    for script in response.css(".srp_pagination_links_container script::text").getall():
-        m_current = re.search(r"var\s+current_page\s*=\s*(\d+)", script)
-        m_count = re.search(r"var\s+page_count\s*=\s*(\d+)", script)
+    for script in response.xpath(_PAGINATION_SCRIPT_XPATH).getall():
+        m_current = _CURRENT_PAGE_RE.search(script)
+        m_count = _PAGE_COUNT_RE.search(script)
         if m_current:
             current_page = int(m_current.group(1))
         if m_count:
             page_count = int(m_count.group(1))
 
-    if current_page >= page_count:
-        return None
-
-    # Build next page URL by setting p=<next>
-    parsed = urlparse(response.url)
-    qs = parse_qs(parsed.query)
-    qs["p"] = [str(current_page + 1)]
-    # Use quote_via to preserve special chars in param names (e.g. "s:pr")
-    # that the DEP site expects unencoded.
-    new_query = urlencode({k: v[0] for k, v in qs.items()}, quote_via=lambda s, *_a, **_kw: s)
-    return urlunparse(parsed._replace(query=new_query))
+    return current_page, page_count
@@ -29,9 +29,10 @@ Example usage::
 
 from __future__ import annotations
 
+import functools
 import json
 import re
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus, urlparse
 
 import scrapy
 from scrapy.http import HtmlResponse, JsonResponse
@@ -43,17 +44,19 @@ from car_inventory_scraper.parsing_helpers import (
     normalize_color,
     normalize_drivetrain,
     parse_price,
+    search_from_marker,
 )
 
 # Default page size for the Search Service API.
 _DEFAULT_PER_PAGE = 20
 
-# Fields we request from the Search Service API.
+# Fields we request from the Search Service API — only those read by
+# ``_listing_to_item``, so the API never sends (and we never decode) bulky
+# unused objects such as ``media`` or ``dealer``.
 _REQUESTED_FIELDS = [
-    "vin", "stock", "type", "year", "make", "model", "trim",
-    "model_number", "date_in_stock", "mileage", "vdp_url", "source_id",
-    "styles", "mechanical", "pricing", "dealer", "media",
-    "extra_fields", "status", "manufacturer_model_code",
+    "vin", "stock", "year", "trim", "model_number",
+    "manufacturer_model_code", "vdp_url", "styles", "mechanical",
+    "pricing", "extra_fields",
 ]
 
 # The ``status`` filter ensures we only get published/visible listings.
@@ -78,6 +81,13 @@ class DealerInspireSpider(scrapy.Spider):
 
     name = "dealerinspire"
 
+    # Result pages are independent JSON API calls once the first page
+    # gives the total, so allow a few in flight at once.
+    custom_settings = {
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 4,
+        "DOWNLOAD_DELAY": 0.25,
+    }
+
     # Passed via ``-a url=…`` or the CLI wrapper.
     def __init__(
         self,
@@ -131,9 +141,8 @@ class DealerInspireSpider(scrapy.Spider):
 
             dealer_name = self._dealer_name_override or self._domain
 
-            yield self._search_request(
-                search_cfg, facet_filters, _DEFAULT_PER_PAGE, dealer_name, page=1,
-            )
+            base_body = _search_body_base(facet_filters, _DEFAULT_PER_PAGE)
+            yield self._search_request(search_cfg, base_body, dealer_name, page=1)
         else:
             # Mode A — fetch the SRP page to extract Search Service config.
             yield scrapy.Request(
@@ -174,12 +183,10 @@ class DealerInspireSpider(scrapy.Spider):
         refinements = _extract_refinements(response)
         facet_filters = _map_refinements(refinements, field_map)
 
-        per_page = _extract_per_page(response)
+        base_body = _search_body_base(facet_filters, _extract_per_page(response))
 
         # Request page 1 from the Search Service (one-indexed).
-        yield self._search_request(
-            search_cfg, facet_filters, per_page, dealer_name, page=1,
-        )
+        yield self._search_request(search_cfg, base_body, dealer_name, page=1)
 
     # ------------------------------------------------------------------
     # Step 2 — Parse Search Service JSON results -> CarItems
@@ -191,15 +198,17 @@ class DealerInspireSpider(scrapy.Spider):
         Yields a :class:`CarItem` for each vehicle listing and follows
         with the next page if more results are available.
         """
-        data = json.loads(response.text)
+        # json.loads accepts the raw UTF-8 body, skipping the str decode
+        # Scrapy does for ``.text``.
+        data = json.loads(response.body)
         inner = data.get("data", data)
         listings = inner.get("listings", [])
         total = inner.get("total_vehicle_count", len(listings))
         page = response.meta["page"]
-        per_page = response.meta["per_page"]
         dealer_name = response.meta["dealer_name"]
         search_cfg = response.meta["search_cfg"]
-        facet_filters = response.meta["facet_filters"]
+        base_body = response.meta["base_body"]
+        per_page = base_body["perPage"]
 
         nb_pages = (total + per_page - 1) // per_page if per_page else 1
 
@@ -218,11 +227,13 @@ class DealerInspireSpider(scrapy.Spider):
                 yield item
 
         # --- Pagination ---
-        if page < nb_pages:
-            yield self._search_request(
-                search_cfg, facet_filters, per_page, dealer_name,
-                page=page + 1,
-            )
+        # The first page reveals the total, so request every remaining
+        # page at once rather than chaining them one after another.
+        if page == 1:
+            for next_page in range(2, nb_pages + 1):
+                yield self._search_request(
+                    search_cfg, base_body, dealer_name, page=next_page,
+                )
 
     # ------------------------------------------------------------------
     # Search Service request builder
@@ -231,24 +242,21 @@ class DealerInspireSpider(scrapy.Spider):
     def _search_request(
         self,
         search_cfg: dict,
-        facet_filters: dict[str, list],
-        per_page: int,
+        base_body: dict,
         dealer_name: str,
         page: int,
     ) -> scrapy.Request:
-        """Build a Scrapy request to the Search Service API."""
+        """Build a Scrapy request to the Search Service API.
+
+        *base_body* is the page-independent part of the payload from
+        :func:`_search_body_base`; only the page number is added here.
+        """
         url = (
             f"{search_cfg['api_url'].rstrip('/')}"
             f"/api/v1/listings/{search_cfg['ccid']}/search"
         )
 
-        body = json.dumps({
-            "page": page,
-            "perPage": per_page,
-            "filters": {"status": _STATUS_FILTER},
-            "facetFilters": facet_filters,
-            "requestedFields": _REQUESTED_FIELDS,
-        })
+        body = json.dumps({"page": page, **base_body})
 
         return scrapy.Request(
             url,
@@ -262,8 +270,7 @@ class DealerInspireSpider(scrapy.Spider):
             errback=self.errback,
             meta={
                 "search_cfg": search_cfg,
-                "facet_filters": facet_filters,
-                "per_page": per_page,
+                "base_body": base_body,
                 "dealer_name": dealer_name,
                 "page": page,
             },
@@ -281,6 +288,18 @@ class DealerInspireSpider(scrapy.Spider):
 # Helpers — Search Service config extraction
 # ---------------------------------------------------------------------------
 
+_SEARCH_SERVICE_RE = re.compile(r"var\s+SEARCH_SERVICE\s*=\s*(\{[^;]+\})\s*;")
+_FIELD_MAP_RE = re.compile(
+    r"var\s+SEARCH_SERVICE_FIELD_MAP\s*=\s*(\{.+?\})\s*;\s*\n",
+    re.DOTALL,
+)
+_PARAMS_RE = re.compile(r"var\s+PARAMS\s*=\s*(\{.+?\})\s*;")
+_ILS_RE = re.compile(
+    r"var\s+inventoryLightningSettings\s*=\s*(\{.+?\})\s*;\s*\n",
+    re.DOTALL,
+)
+
+
 def _extract_search_service_config(response: HtmlResponse) -> dict | None:
     """Extract Search Service connection details from the SRP page's JavaScript.
 
@@ -290,12 +309,7 @@ def _extract_search_service_config(response: HtmlResponse) -> dict | None:
     Returns a dict with ``api_url``, ``ccid``, and ``api_key`` keys,
     or ``None`` if extraction fails.
     """
-    text = response.text
-
-    m = re.search(
-        r"var\s+SEARCH_SERVICE\s*=\s*(\{[^;]+\})\s*;",
-        text,
-    )
+    m = search_from_marker(_SEARCH_SERVICE_RE, response.text, "SEARCH_SERVICE")
     if not m:
         return None
     try:
@@ -321,13 +335,7 @@ def _extract_field_map(response: HtmlResponse) -> dict[str, str]:
 
     Falls back to :data:`_DEFAULT_FIELD_MAP` if not found.
     """
-    text = response.text
-
-    m = re.search(
-        r"var\s+SEARCH_SERVICE_FIELD_MAP\s*=\s*(\{.+?\})\s*;\s*\n",
-        text,
-        re.DOTALL,
-    )
+    m = search_from_marker(_FIELD_MAP_RE, response.text, "SEARCH_SERVICE_FIELD_MAP")
     if not m:
         return dict(_DEFAULT_FIELD_MAP)
     try:
@@ -342,9 +350,9 @@ def _extract_field_map(response: HtmlResponse) -> dict[str, str]:
 
 def _extract_per_page(response: HtmlResponse) -> int:
     """Extract ``hitsPerPage`` from embedded JS."""
-    text = response.text
-    m = re.search(r"var\s+PARAMS\s*=\s*(\{.+?\})\s*;", text)
-    if m:
+    m = search_from_marker(_PARAMS_RE, response.text, "PARAMS")
+    # Skip decoding the blob entirely when it has no hitsPerPage key.
+    if m and "hitsPerPage" in m.group(1):
         try:
             params = json.loads(m.group(1))
             return int(params.get("hitsPerPage", _DEFAULT_PER_PAGE))
@@ -359,14 +367,9 @@ def _extract_refinements(response: HtmlResponse) -> dict[str, list[str]]:
     Merges refinements from the JS variable with ``_dFR`` query parameters
     from the URL.
     """
-    text = response.text
     refinements: dict[str, list[str]] = {}
 
-    m = re.search(
-        r"var\s+inventoryLightningSettings\s*=\s*(\{.+?\})\s*;\s*\n",
-        text,
-        re.DOTALL,
-    )
+    m = search_from_marker(_ILS_RE, response.text, "inventoryLightningSettings")
     if m:
         try:
             ils = json.loads(m.group(1))
@@ -377,13 +380,10 @@ def _extract_refinements(response: HtmlResponse) -> dict[str, list[str]]:
     # Merge URL _dFR parameters.
     url_refinements = _extract_url_refinements(response.url)
     for field, vals in url_refinements.items():
-        if field not in refinements:
-            refinements[field] = vals
-        else:
-            existing = set(refinements[field])
-            for v in vals:
-                if v not in existing:
-                    refinements[field].append(v)
+        # dict.fromkeys doubles as an insertion-ordered set for the merge.
+        merged = dict.fromkeys(refinements.get(field, ()))
+        merged.update(dict.fromkeys(vals))
+        refinements[field] = list(merged)
 
     return refinements
 
@@ -396,18 +396,29 @@ def _extract_url_refinements(url: str) -> dict[str, list[str]]:
     extracts them so they can be merged with the refinements from
     ``inventoryLightningSettings``.
     """
-    refinements: dict[str, list[str]] = {}
-    qs = parse_qs(urlparse(url).query)
-    pattern = re.compile(r"^_dFR\[([^\]]+)\]\[\d+\]$")
-    for key, values in qs.items():
-        m = pattern.match(key)
-        if m:
-            field = m.group(1)
-            refinements.setdefault(field, [])
-            for v in values:
-                if v not in refinements[field]:
-                    refinements[field].append(v)
-    return refinements
+    # Values per field are collected as dict keys (an insertion-ordered
+    # set) so de-duplication is a hash lookup rather than a list scan.
+    refinements: dict[str, dict[str, None]] = {}
+    for pair in urlparse(url).query.split("&"):
+        # The "_dFR" prefix survives percent-encoding of the brackets, so
+        # unrelated params are skipped before anything is unquoted.
+        if not pair.startswith("_dFR"):
+            continue
+        raw_key, _, raw_value = pair.partition("=")
+        key = unquote_plus(raw_key)
+        value = unquote_plus(raw_value)
+        # Expect exactly ``_dFR[<field>][<index>]``.
+        close = key.find("]", 5)
+        index = key[close + 1:]
+        if (
+            not key.startswith("_dFR[")
+            or close <= 5
+            or not (index.startswith("[") and index.endswith("]") and index[1:-1].isdigit())
+            or not value
+        ):
+            continue
+        refinements.setdefault(key[5:close], {})[value] = None
+    return {field: list(vals) for field, vals in refinements.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -432,15 +443,12 @@ def _map_refinements(
     result: dict[str, list] = {}
     for field, vals in refinements.items():
         mapped = field_map.get(field, field.lower())
-        converted = []
-        for v in vals:
-            if mapped == "year" or field == "year":
-                try:
-                    converted.append(int(v))
-                except (ValueError, TypeError):
-                    converted.append(v)
-            else:
-                converted.append(v)
+        # The year check depends only on the field, so decide it once per
+        # field rather than once per value.
+        if mapped == "year" or field == "year":
+            converted = [_year_value(v) for v in vals]
+        else:
+            converted = list(vals)
         if mapped in result:
             result[mapped].extend(converted)
         else:
@@ -448,6 +456,27 @@ def _map_refinements(
     return result
 
 
+def _search_body_base(facet_filters: dict[str, list], per_page: int) -> dict:
+    """Return the Search Service request body minus the page number.
+
+    Built once per search config and reused for every page request.
+    """
+    return {
+        "perPage": per_page,
+        "filters": {"status": _STATUS_FILTER},
+        "facetFilters": facet_filters,
+        "requestedFields": _REQUESTED_FIELDS,
+    }
+
+
+def _year_value(v):
+    """Return *v* as an ``int`` year, or unchanged if it isn't numeric."""
+    try:
+        return int(v)
+    except (ValueError, TypeError):
+        return v
+
+
 # ---------------------------------------------------------------------------
 # Helpers — Search Service listing -> CarItem
 # ---------------------------------------------------------------------------
@@ -458,60 +487,50 @@ def _listing_to_item(
     dealer_url: str,
 ) -> CarItem | None:
     """Convert a Search Service listing into a :class:`CarItem`."""
-    vin = listing.get("vin")
+    get = listing.get
+    vin = get("vin")
     if not vin:
         return None
 
-    item = CarItem()
-
-    # --- Identifiers ---
-    item["vin"] = vin
-    item["stock_number"] = listing.get("stock") or None
-    item["model_code"] = (
-        listing.get("manufacturer_model_code")
-        or listing.get("model_number")
-        or None
-    )
-
-    # --- Vehicle info ---
-    item["year"] = str(listing["year"]) if listing.get("year") else None
-    item["trim"] = listing.get("trim") or None
-
-    mechanical = listing.get("mechanical") or {}
-    item["drivetrain"] = normalize_drivetrain(mechanical.get("drivetrain", ""))
-
-    # --- Colors ---
-    styles = listing.get("styles") or {}
-    item["exterior_color"] = normalize_color(styles.get("exterior_color"))
-    item["interior_color"] = normalize_color(styles.get("interior_color"))
+    mechanical = get("mechanical") or {}
+    styles = get("styles") or {}
+    pricing = get("pricing") or {}
+    extra = get("extra_fields") or {}
+    lightning = extra.get("lightning") or {}
 
     # --- Pricing ---
-    pricing = listing.get("pricing") or {}
     msrp = parse_price(pricing.get("msrp"))
     our_price = (
         parse_price(pricing.get("our_price"))
         or parse_price(pricing.get("price"))
     )
-    item["msrp"] = msrp
-    item["total_price"] = our_price or msrp
-
-    # --- Packages ---
-    item["packages"] = None  # not available in Search Service
-
-    # --- Status ---
-    extra = listing.get("extra_fields") or {}
-    lightning = extra.get("lightning") or {}
-    item["status"] = _extract_status(listing, lightning)
 
-    # --- Availability date ---
-    item["availability_date"] = lightning.get("statusETA") or None
-
-    # --- Dealer / links ---
-    item["dealer_name"] = dealer_name
-    item["dealer_url"] = dealer_url
-    item["detail_url"] = listing.get("vdp_url") or None
-
-    return item
+    # Build the item in one constructor call rather than field-by-field.
+    return CarItem(
+        # --- Identifiers ---
+        vin=vin,
+        stock_number=get("stock") or None,
+        model_code=get("manufacturer_model_code") or get("model_number") or None,
+        # --- Vehicle info ---
+        year=str(listing["year"]) if get("year") else None,
+        trim=get("trim") or None,
+        drivetrain=normalize_drivetrain(mechanical.get("drivetrain", "")),
+        # --- Colors ---
+        exterior_color=normalize_color(styles.get("exterior_color")),
+        interior_color=normalize_color(styles.get("interior_color")),
+        # --- Pricing ---
+        msrp=msrp,
+        total_price=our_price or msrp,
+        # --- Packages ---
+        packages=None,  # not available in Search Service
+        # --- Status / availability date ---
+        status=_extract_status(listing, lightning),
+        availability_date=lightning.get("statusETA") or None,
+        # --- Dealer / links ---
+        dealer_name=dealer_name,
+        dealer_url=dealer_url,
+        detail_url=get("vdp_url") or None,
+    )
 
 
 def _extract_status(listing: dict, lightning: dict) -> str | None:
@@ -527,8 +546,13 @@ def _extract_status(listing: dict, lightning: dict) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=64)
 def _normalize_status(text: str) -> str:
-    """Normalise common status labels to a consistent form."""
+    """Normalise common status labels to a consistent form.
+
+    Dealers only use a handful of distinct labels, so results are cached
+    and repeat labels cost a single dict lookup.
+    """
     lower = text.strip().lower().replace("-", " ")
     if "transit" in lower:
         return "In Transit"
@@ -16,9 +16,10 @@ from __future__ import annotations
 import json
 import math
 import re
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import urlparse
 
 import scrapy
+from parsel import css2xpath
 from scrapy.http import HtmlResponse
 
 from car_inventory_scraper.spiders import log_request_failure
@@ -28,6 +29,29 @@ from car_inventory_scraper.items import CarItem
 # Number of vehicles DealerOn displays per search-results page.
 _VEHICLES_PER_PAGE = 12
 
+# CSS selectors, translated to XPath once at import rather than on every
+# ``.css()`` call.
+_TITLE_XPATH = css2xpath("title::text")
+# Only the first VDP container is used, so stop at the first match.
+_VDP_XPATH = f"({css2xpath('.vdp[data-vehicle-information]')})[1]"
+_VDP_FALLBACK_XPATH = f"({css2xpath('[data-vin]')})[1]"
+_HIGHLIGHT_LABEL_XPATH = css2xpath(".vehicle-highlights__label::text")
+_PKG_INFO_XPATH = css2xpath(".package-info")
+_PKG_NAME_XPATH = css2xpath(".package-info__name::text")
+_PKG_PRICE_XPATH = css2xpath(".package-info__price::text")
+_AVAIL_XPATH = css2xpath("#price-stack .inTransitDisclaimer::text")
+_JSON_LD_XPATH = css2xpath('script[type="application/ld+json"]::text')
+_TAGGING_DATA_XPATH = css2xpath("script#dealeron_tagging_data::text")
+
+# "Estimated Availability MM/DD/YYYY" in the in-transit disclaimer.  The
+# possessive ``\s++`` lets non-matching text fail without backtracking.
+_AVAIL_RE = re.compile(r"availability\s++(\d{2}/\d{2}/\d{2,4})", re.IGNORECASE)
+
+# Drivetrain tokens in priority order — "4X4 / AWD" reports AWD.  The
+# data-name fallback has never recognised 4X4 / 4X2.
+_DRIVETRAIN_TOKENS = ("AWD", "4WD", "FWD", "RWD", "4X4", "4X2")
+_NAME_DRIVETRAIN_TOKENS = ("AWD", "4WD", "FWD", "RWD")
+
 
 class DealerOnSpider(scrapy.Spider):
     """Scrape vehicle inventory from a DealerOn-powered dealership site."""
@@ -67,21 +91,28 @@ class DealerOnSpider(scrapy.Spider):
         Pagination uses ``itemCount`` from ``#dealeron_tagging_data``.
         """
         base_url = response.url
+        # Pages 2+ receive the name worked out on page 1 via meta.
         dealer_name = (
             self._dealer_name_override
-            or response.css("title::text").get("").split("|")[-1].strip()
+            or response.meta.get("dealer_name")
+            or response.xpath(_TITLE_XPATH).get("").split("|")[-1].strip()
         )
 
         # --- Extract vehicle list from ld+json ---
-        detail_urls = _extract_vehicle_urls(response, base_url)
+        detail_urls = _extract_vehicle_urls(response)
+        if not detail_urls:
+            self.logger.warning("[%s] No vehicle URLs found in ld+json", self._domain)
         self.logger.info(
             "[%s] Found %d vehicles on %s",
             self._domain, len(detail_urls), response.url,
         )
 
         for detail_url in detail_urls:
+            # Drain queued detail pages ahead of further search pages so the
+            # backlog of VDP requests stays bounded on large inventories.
             yield scrapy.Request(
                 detail_url,
+                priority=1,
                 meta={
                     "dealer_name": dealer_name,
                     "dealer_url": base_url,
@@ -104,6 +135,7 @@ class DealerOnSpider(scrapy.Spider):
                     next_url = _build_page_url(self.start_url, page)
                     yield scrapy.Request(
                         next_url,
+                        meta={"dealer_name": dealer_name},
                         callback=self.parse_search,
                         errback=self.errback,
                     )
@@ -125,73 +157,63 @@ class DealerOnSpider(scrapy.Spider):
         item["dealer_url"] = response.meta.get("dealer_url", "")
 
         # The main VDP container holds all vehicle metadata as data attrs
-        vdp = response.css(".vdp[data-vehicle-information]")
-        if not vdp:
-            # Fallback: try any element with data-vin
-            vdp = response.css("[data-vin]")
-        vdp = vdp[0] if vdp else response
+        # (fallback: the first element with data-vin).
+        vdp = response.xpath(_VDP_XPATH) or response.xpath(_VDP_FALLBACK_XPATH)
+        # ``Selector.attrib`` copies the element's whole attribute table on
+        # every access, so take that copy once and read keys from the dict.
+        attrs = vdp[0].attrib if vdp else {}
 
         # --- Core vehicle info from data attributes ---
-        item["vin"] = vdp.attrib.get("data-vin")
-        item["stock_number"] = vdp.attrib.get("data-stocknum") or None
-        item["model_code"] = vdp.attrib.get("data-modelcode")
-        item["year"] = vdp.attrib.get("data-year")
-        item["trim"] = vdp.attrib.get("data-trim")
-        item["exterior_color"] = _strip_html(vdp.attrib.get("data-extcolor", ""))
-        item["interior_color"] = _strip_html(vdp.attrib.get("data-intcolor", ""))
+        item["vin"] = attrs.get("data-vin")
+        item["stock_number"] = attrs.get("data-stocknum") or None
+        item["model_code"] = attrs.get("data-modelcode")
+        item["year"] = attrs.get("data-year")
+        item["trim"] = attrs.get("data-trim")
+        item["exterior_color"] = _strip_html(attrs.get("data-extcolor", ""))
+        item["interior_color"] = _strip_html(attrs.get("data-intcolor", ""))
 
         # Drivetrain: prefer Highlighted Features section, fall back to data-name
         drivetrain = None
-        for feature in response.css(".vehicle-highlights__label::text").getall():
-            feature_upper = feature.strip().upper()
-            for token in ("AWD", "4WD", "FWD", "RWD", "4X4", "4X2"):
-                if token in feature_upper:
-                    drivetrain = token
-                    break
+        for feature in response.xpath(_HIGHLIGHT_LABEL_XPATH).getall():
+            drivetrain = _drivetrain_token(feature, _DRIVETRAIN_TOKENS)
             if drivetrain:
                 break
 
         if not drivetrain:
-            name = vdp.attrib.get("data-name", "")
-            for token in ("AWD", "4WD", "FWD", "RWD", "4x4", "4x2"):
-                if token in name.upper():
-                    drivetrain = token
-                    break
+            drivetrain = _drivetrain_token(attrs.get("data-name", ""), _NAME_DRIVETRAIN_TOKENS)
 
         item["drivetrain"] = drivetrain
 
         # --- Packages & Accessories (CSS class: .package-info) ---
         packages: list[dict[str, str | int]] = []
-        for pkg in response.css(".package-info"):
-            pkg_name = pkg.css(".package-info__name::text").get("").strip()
-            price_str = pkg.css(".package-info__price::text").get("").strip()
+        for pkg in response.xpath(_PKG_INFO_XPATH):
+            pkg_name = pkg.xpath(_PKG_NAME_XPATH).get("").strip()
+            price_str = pkg.xpath(_PKG_PRICE_XPATH).get("").strip()
             if not pkg_name:
                 continue
             packages.append({"name": pkg_name, "price": parse_price(price_str)})
         item["packages"] = packages or None
 
         # --- Pricing ---
-        item["msrp"] = parse_price(vdp.attrib.get("data-msrp"))
+        item["msrp"] = parse_price(attrs.get("data-msrp"))
 
-        total_price = parse_price(vdp.attrib.get("data-price"))
+        total_price = parse_price(attrs.get("data-price"))
         item["total_price"] = total_price if total_price else item["msrp"]
 
         # --- Status from data attributes ---
-        if vdp.attrib.get("data-instock", "").lower() == "true":
+        if attrs.get("data-instock", "").lower() == "true":
             item["status"] = "In Stock"
-        elif vdp.attrib.get("data-intransit", "").lower() == "true":
+        elif attrs.get("data-intransit", "").lower() == "true":
             item["status"] = "In Transit"
-        elif vdp.attrib.get("data-inproduction", "").lower() == "true":
+        elif attrs.get("data-inproduction", "").lower() == "true":
             item["status"] = "In Production"
         else:
             item["status"] = None
 
         # --- Availability date ---
-        avail_parts = response.css("#price-stack .inTransitDisclaimer::text").getall()
+        avail_parts = response.xpath(_AVAIL_XPATH).getall()
         avail_text = " ".join(avail_parts)
-        avail = re.search(
-            r"(?i)(?:estimated\s+)?availability\s+(\d{2}/\d{2}/\d{2,4})", avail_text
-        )
+        avail = _AVAIL_RE.search(avail_text)
         item["availability_date"] = avail.group(1) if avail else None
 
         yield item
@@ -208,9 +230,10 @@ class DealerOnSpider(scrapy.Spider):
 # Helpers — data cleaning
 # ---------------------------------------------------------------------------
 
-_HTML_TAG_RE = re.compile(r"<a\b[^>]*>.*?</a>|<[^>]+>", re.DOTALL)
-_BRACKET_TAG_RE = re.compile(r"\s*\[Extra_Cost_Color\]", re.IGNORECASE)
-_TRADEMARK_SUFFIX_RE = re.compile(r"\s*[®]", re.IGNORECASE)
+# ``[Extra_Cost_Color]`` annotations and ``®`` marks, with any whitespace
+# before them.  ``\s*+`` is possessive (3.11+) so positions that don't
+# lead to a match fail without backtracking through the whitespace.
+_ANNOTATION_RE = re.compile(r"\s*+(?:\[Extra_Cost_Color\]|®)", re.IGNORECASE)
 
 
 def _strip_html(value: str) -> str | None:
@@ -226,21 +249,67 @@ def _strip_html(value: str) -> str | None:
     """
     if not value:
         return None
-    cleaned = _HTML_TAG_RE.sub("", value)
-    cleaned = _BRACKET_TAG_RE.sub("", cleaned)
-    cleaned = _TRADEMARK_SUFFIX_RE.sub("", cleaned).strip()
+    cleaned = _ANNOTATION_RE.sub("", _strip_tags(value)).strip()
     return cleaned or None
 
 
+def _strip_tags(value: str) -> str:
+    """Drop ``<…>`` tags, and anchors together with their content, from *value*.
+
+    A linear ``str.find`` scan: the values are short colour names that
+    usually contain no markup at all, which returns immediately.
+    """
+    if "<" not in value:
+        return value
+    out: list[str] = []
+    i = 0
+    while (lt := value.find("<", i)) != -1:
+        out.append(value[i:lt])
+        gt = value.find(">", lt + 1)
+        if gt == -1:
+            # No closing ">" anywhere after — the rest is plain text.
+            i = lt
+            break
+        if gt == lt + 1:
+            # A bare "<>" is not a tag; keep the "<" and move on.
+            out.append("<")
+            i = lt + 1
+            continue
+        # Disclaimer anchors are removed along with their text.
+        if value.startswith("<a", lt) and not (value[lt + 2].isalnum() or value[lt + 2] == "_"):
+            end = value.find("</a>", gt + 1)
+            if end != -1:
+                i = end + 4
+                continue
+        i = gt + 1
+    out.append(value[i:])
+    return "".join(out)
+
+
+def _drivetrain_token(text: str, tokens: tuple[str, ...]) -> str | None:
+    """Return the first of *tokens* (in priority order) found in *text*."""
+    upper = text.upper()
+    for token in tokens:
+        if token in upper:
+            return token
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Helpers — search-page JSON extraction
 # ---------------------------------------------------------------------------
 
-def _extract_vehicle_urls(response: HtmlResponse, base_url: str) -> list[str]:
+def _extract_vehicle_urls(response: HtmlResponse) -> list[str]:
     """Extract vehicle detail URLs from a ``<script type="application/ld+json">``
     block containing a schema.org ``ItemList``.
+
+    Returns an empty list if no such block is found.
     """
-    for ld_script in response.css('script[type="application/ld+json"]::text').getall():
+    for ld_script in response.xpath(_JSON_LD_XPATH).getall():
+        # SRPs carry other ld+json blocks too (dealer, breadcrumbs) —
+        # only decode the one that can be the ItemList.
+        if '"ItemList"' not in ld_script:
+            continue
         try:
             ld_data = json.loads(ld_script)
             if ld_data.get("@type") == "ItemList":
@@ -251,11 +320,6 @@ def _extract_vehicle_urls(response: HtmlResponse, base_url: str) -> list[str]:
                 ]
         except (json.JSONDecodeError, KeyError, TypeError):
             continue
-
-    import logging
-    logging.getLogger(__name__).warning(
-        "[%s] No vehicle URLs found in ld+json", urlparse(base_url).netloc,
-    )
     return []
 
 
@@ -264,8 +328,8 @@ def _extract_item_count(response: HtmlResponse) -> int | None:
 
     Returns ``None`` if the script tag is missing or unparseable.
     """
-    raw = response.css("script#dealeron_tagging_data::text").get()
-    if not raw:
+    raw = response.xpath(_TAGGING_DATA_XPATH).get()
+    if not raw or '"itemCount"' not in raw:
         return None
     try:
         data = json.loads(raw)
@@ -274,23 +338,32 @@ def _extract_item_count(response: HtmlResponse) -> int | None:
         return None
 
 
+# The ``pt`` (page) query parameter, with the ``?``/``&`` that precedes it.
+_PT_PARAM_RE = re.compile(r"([?&])pt=([^&#]*)")
+
+
 def _current_page_number(url: str) -> int:
     """Return the current page number from the ``pt`` query parameter.
 
     Defaults to 1 when ``pt`` is absent.
     """
-    qs = parse_qs(urlparse(url).query)
+    m = _PT_PARAM_RE.search(url)
     try:
-        return int(qs["pt"][0])
-    except (KeyError, IndexError, ValueError):
+        return int(m.group(2)) if m else 1
+    except ValueError:
         return 1
 
 
 def _build_page_url(base_url: str, page: int) -> str:
-    """Return *base_url* with the ``pt`` query parameter set to *page*."""
-    parsed = urlparse(base_url)
-    qs = parse_qs(parsed.query)
-    qs["pt"] = [str(page)]
-    new_query = urlencode({k: v[0] for k, v in qs.items()})
-    return urlunparse(parsed._replace(query=new_query))
+    """Return *base_url* with the ``pt`` query parameter set to *page*.
 
+    Edits the URL string in place rather than round-tripping the whole
+    query through ``parse_qs``/``urlencode``.
+    """
+    page_param = f"pt={page}"
+    new_url, replaced = _PT_PARAM_RE.subn(rf"\g<1>{page_param}", base_url, count=1)
+    if replaced:
+        return new_url
+    url, hash_, fragment = base_url.partition("#")
+    sep = "&" if "?" in url else "?"
+    return f"{url}{sep}{page_param}{hash_}{fragment}"
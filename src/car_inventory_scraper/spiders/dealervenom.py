@@ -27,10 +27,12 @@ Example usage::
 from __future__ import annotations
 
 import json
+import math
 import re
 from urllib.parse import urljoin, urlparse, parse_qs
 
 import scrapy
+from parsel import css2xpath
 
 from car_inventory_scraper.spiders import log_request_failure
 from scrapy.http import HtmlResponse, TextResponse
@@ -44,8 +46,29 @@ from car_inventory_scraper.parsing_helpers import (
 from car_inventory_scraper.items import CarItem
 
 
-# Results per Typesense page — matches the default DealerVenom SRP page size.
-_TYPESENSE_PAGE_SIZE = 24
+# Results per Typesense page — the API maximum, so most inventories come
+# back in one or two requests rather than one per 24-vehicle SRP page.
+_TYPESENSE_PAGE_SIZE = 250
+
+_TITLE_XPATH = css2xpath("title::text")
+
+# VDP package selectors, translated to XPath once at import.
+_PKG_ITEM_XPATH = css2xpath(".vdp-package-item")
+_PKG_NAME_XPATH = css2xpath(".vdp-package-name::text")
+_PKG_PRICE_XPATH = css2xpath(".vdp-package-price::text")
+
+# Typesense connection details embedded in the SRP's JavaScript.
+_TS_INDEX_RE = re.compile(r'var\s+indexName\s*=\s*"([^"]+)"')
+_TS_APIKEY_RE = re.compile(r'apiKey:\s*"([^"]+)"')
+_TS_HOST_RE = re.compile(r"host:\s*['\"]([^'\"]+)['\"]")
+_TS_PORT_RE = re.compile(r"port:\s*(\d+)")
+_TS_PROTO_RE = re.compile(r"protocol:\s*['\"]([^'\"]+)['\"]")
+
+# Status hints in a Typesense document's ``smartpathDisclaimer``.
+_SALE_PENDING_RE = re.compile(r"sale\s+pending", re.IGNORECASE)
+_AVAIL_DATE_RE = re.compile(
+    r"(?:Estimated\s+)?availability\s+(\d{2}/\d{2}/\d{2,4})", re.IGNORECASE,
+)
 
 
 class DealerVenomSpider(scrapy.Spider):
@@ -53,6 +76,14 @@ class DealerVenomSpider(scrapy.Spider):
 
     name = "dealervenom"
 
+    # Every vehicle costs one plain-HTTP VDP fetch for its packages, so
+    # allow a few of those in flight per dealer instead of the global
+    # one-at-a-time, 2 s-apart default.
+    custom_settings = {
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 4,
+        "DOWNLOAD_DELAY": 0.25,
+    }
+
     # Passed via ``-a url=…`` or the CLI wrapper.
     def __init__(self, url: str | None = None, dealer_name: str | None = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -64,6 +95,10 @@ class DealerVenomSpider(scrapy.Spider):
         self.start_url = url
         self._dealer_name_override = dealer_name
         self._domain = urlparse(url).netloc
+        self._base_url = f"https://{self._domain}"
+        # VINs whose VDP has already been requested — the same vehicle
+        # can come back on more than one Typesense page.
+        self._seen_vins: set[str] = set()
 
     # ------------------------------------------------------------------
     # Step 1 — Fetch the SRP page to extract Typesense credentials
@@ -92,26 +127,14 @@ class DealerVenomSpider(scrapy.Spider):
         # Derive the dealer name from the page title if not overridden.
         dealer_name = (
             self._dealer_name_override
-            or response.css("title::text").get("").split("|")[-1].strip()
+            or response.xpath(_TITLE_XPATH).get("").split("|")[-1].strip()
         )
 
         # Build Typesense filter from query-string parameters.
         filters = _build_typesense_filter(self.start_url)
 
         # Request page 1 from Typesense.
-        api_url = _typesense_search_url(ts, filters, page=1)
-        yield scrapy.Request(
-            api_url,
-            headers={"X-TYPESENSE-API-KEY": ts["api_key"]},
-            callback=self.parse_typesense_results,
-            errback=self.errback,
-            meta={
-                "typesense": ts,
-                "filters": filters,
-                "dealer_name": dealer_name,
-                "ts_page": 1,
-            },
-        )
+        yield self._typesense_request(ts, filters, dealer_name, page=1)
 
     # ------------------------------------------------------------------
     # Step 2 — Parse Typesense JSON results → CarItems + VDP requests
@@ -124,7 +147,8 @@ class DealerVenomSpider(scrapy.Spider):
         follows with a plain-HTTP request to the VDP to scrape packages.
         Handles pagination automatically.
         """
-        data = json.loads(response.text)
+        # Decode straight from the body bytes, skipping the str decode.
+        data = json.loads(response.body)
         hits = data.get("hits", [])
         found = data.get("found", 0)
         ts_page = response.meta["ts_page"]
@@ -137,11 +161,16 @@ class DealerVenomSpider(scrapy.Spider):
             self._domain, len(hits), ts_page, found,
         )
 
-        base_url = f"https://{urlparse(self.start_url).netloc}"
-
         for hit in hits:
             doc = hit.get("document", {})
-            item = _typesense_doc_to_item(doc, dealer_name, self.start_url, base_url)
+            item = _typesense_doc_to_item(
+                doc, dealer_name, self.start_url, self._base_url,
+            )
+            vin = item["vin"]
+            if vin:
+                if vin in self._seen_vins:
+                    continue
+                self._seen_vins.add(vin)
 
             # Request the VDP to scrape packages.
             detail_url = item["detail_url"]
@@ -153,21 +182,33 @@ class DealerVenomSpider(scrapy.Spider):
             )
 
         # --- Pagination ---
-        if ts_page * _TYPESENSE_PAGE_SIZE < found:
-            next_page = ts_page + 1
-            api_url = _typesense_search_url(ts, filters, page=next_page)
-            yield scrapy.Request(
-                api_url,
-                headers={"X-TYPESENSE-API-KEY": ts["api_key"]},
-                callback=self.parse_typesense_results,
-                errback=self.errback,
-                meta={
-                    "typesense": ts,
-                    "filters": filters,
-                    "dealer_name": dealer_name,
-                    "ts_page": next_page,
-                },
-            )
+        # The first page reveals the total, so request every remaining
+        # page at once rather than chaining them one after another.
+        if ts_page == 1:
+            total_pages = math.ceil(found / _TYPESENSE_PAGE_SIZE)
+            for next_page in range(2, total_pages + 1):
+                yield self._typesense_request(ts, filters, dealer_name, page=next_page)
+
+    def _typesense_request(
+        self,
+        ts: dict,
+        filters: str,
+        dealer_name: str,
+        page: int,
+    ) -> scrapy.Request:
+        """Build a Scrapy request for one page of Typesense results."""
+        return scrapy.Request(
+            _typesense_search_url(ts, filters, page=page),
+            headers={"X-TYPESENSE-API-KEY": ts["api_key"]},
+            callback=self.parse_typesense_results,
+            errback=self.errback,
+            meta={
+                "typesense": ts,
+                "filters": filters,
+                "dealer_name": dealer_name,
+                "ts_page": page,
+            },
+        )
 
     # ------------------------------------------------------------------
     # Step 3 — Scrape packages from the server-rendered VDP
@@ -178,9 +219,9 @@ class DealerVenomSpider(scrapy.Spider):
         item: CarItem = response.meta["item"]
 
         packages: list[dict[str, str | int]] = []
-        for pkg_el in response.css(".vdp-package-item"):
-            name = pkg_el.css(".vdp-package-name::text").get("").strip()
-            price_str = pkg_el.css(".vdp-package-price::text").get("").strip()
+        for pkg_el in response.xpath(_PKG_ITEM_XPATH):
+            name = pkg_el.xpath(_PKG_NAME_XPATH).get("").strip()
+            price_str = pkg_el.xpath(_PKG_PRICE_XPATH).get("").strip()
             if name:
                 packages.append({
                     "name": name,
@@ -211,29 +252,29 @@ def _extract_typesense_config(response: HtmlResponse) -> dict | None:
     text = response.text
 
     # Index / collection name:  var indexName = "vehicles-TOY46076";
-    m_index = re.search(r'var\s+indexName\s*=\s*"([^"]+)"', text)
+    m_index = _TS_INDEX_RE.search(text)
     if not m_index:
         return None
     index = m_index.group(1)
 
     # API key:  apiKey: "eQUa8iq30l8Tu908Drz9WKqar6tCJGd4",
-    m_key = re.search(r'apiKey:\s*"([^"]+)"', text)
+    m_key = _TS_APIKEY_RE.search(text)
     if not m_key:
         return None
     api_key = m_key.group(1)
 
     # Host:  host: 'hjnrb3s21408ezpfp.a1.typesense.net',
-    m_host = re.search(r"host:\s*['\"]([^'\"]+)['\"]", text)
+    m_host = _TS_HOST_RE.search(text)
     if not m_host:
         return None
     host = m_host.group(1)
 
     # Port (default 443):  port: 443,
-    m_port = re.search(r"port:\s*(\d+)", text)
+    m_port = _TS_PORT_RE.search(text)
     port = int(m_port.group(1)) if m_port else 443
 
     # Protocol (default https):  protocol: 'https'
-    m_proto = re.search(r"protocol:\s*['\"]([^'\"]+)['\"]", text)
+    m_proto = _TS_PROTO_RE.search(text)
     protocol = m_proto.group(1) if m_proto else "https"
 
     return {
@@ -268,15 +309,15 @@ def _build_typesense_filter(srp_url: str) -> str:
     query-string parameters (``model``, ``yr``, etc.).
     """
     qs = parse_qs(urlparse(srp_url).query)
-    parts: list[str] = []
-
-    for qs_key, ts_field in _QS_TO_TYPESENSE.items():
-        vals = qs.get(qs_key)
-        if vals:
-            parts.append(f"{ts_field}:={vals[0]}")
-
-    # Ensure condition:New is always present.
-    if not any(p.startswith("condition:") for p in parts):
+    parts = [
+        f"{ts_field}:={qs[qs_key][0]}"
+        for qs_key, ts_field in _QS_TO_TYPESENSE.items()
+        if qs_key in qs
+    ]
+
+    # Ensure condition:New is always present.  Only the ``condition``
+    # parameter maps to the condition field, so check for it directly.
+    if "condition" not in qs:
         parts.insert(0, "condition:=New")
 
     return " && ".join(parts)
@@ -309,53 +350,59 @@ def _typesense_doc_to_item(
     Packages are *not* populated here — they require a follow-up VDP
     request.
     """
-    item = CarItem()
-
-    # --- Identifiers ---
-    item["vin"] = doc.get("vin")
-    item["stock_number"] = doc.get("stockNumber")
-    item["model_code"] = doc.get("modelCode")
-
-    # --- Vehicle info ---
-    item["year"] = str(doc["year"]) if doc.get("year") else doc.get("yr") and str(doc["yr"])
-    item["trim"] = doc.get("trim")
-    item["drivetrain"] = normalize_drivetrain(doc.get("drivetrain", ""))
-
-    # --- Colors ---
-    item["exterior_color"] = normalize_color(doc.get("exteriorColor"))
-    item["interior_color"] = normalize_color(doc.get("interiorColor"))
+    get = doc.get
 
     # --- Pricing ---
-    item["msrp"] = parse_price(doc.get("msrp"))
-    item["total_price"] = (
-        safe_int(doc.get("finalPriceInt"))
-        or parse_price(doc.get("finalPrice"))
-        or item["msrp"]
-    )
+    msrp = parse_price(get("msrp"))
+    total_price = safe_int(get("finalPriceInt")) or parse_price(get("finalPrice")) or msrp
 
     # --- Detail URL ---
-    vdp_path = doc.get("vdpUrl", "")
-    item["detail_url"] = urljoin(base_url, vdp_path) if vdp_path else ""
-
-    # --- Dealer info ---
-    item["dealer_name"] = dealer_name
-    item["dealer_url"] = dealer_url
+    vdp_path = get("vdpUrl", "")
 
     # --- Status ---
-    status = doc.get("status", "")
+    status = get("status", "")
 
     # Check smartpathDisclaimer for "Sale Pending" and availability date.
-    disclaimer = doc.get("smartpathDisclaimer", "")
-    if re.search(r"(?i)sale\s+pending", disclaimer):
+    disclaimer = get("smartpathDisclaimer", "")
+    if _SALE_PENDING_RE.search(disclaimer):
         status = f"Sale Pending - {status}" if status else "Sale Pending"
 
-    item["status"] = status
-
     # --- Availability date ---
-    avail_match = re.search(
-        r"(?i)(?:Estimated\s+)?availability\s+(\d{2}/\d{2}/\d{2,4})",
-        disclaimer,
+    avail_match = _AVAIL_DATE_RE.search(disclaimer)
+
+    # Build the item in one constructor call rather than field-by-field.
+    return CarItem(
+        # --- Identifiers ---
+        vin=get("vin"),
+        stock_number=get("stockNumber"),
+        model_code=get("modelCode"),
+        # --- Vehicle info ---
+        year=str(doc["year"]) if get("year") else get("yr") and str(doc["yr"]),
+        trim=get("trim"),
+        drivetrain=normalize_drivetrain(get("drivetrain", "")),
+        # --- Colors ---
+        exterior_color=normalize_color(get("exteriorColor")),
+        interior_color=normalize_color(get("interiorColor")),
+        # --- Pricing ---
+        msrp=msrp,
+        total_price=total_price,
+        # --- Detail URL ---
+        detail_url=_absolute_vdp_url(base_url, vdp_path) if vdp_path else "",
+        # --- Dealer info ---
+        dealer_name=dealer_name,
+        dealer_url=dealer_url,
+        # --- Status / availability date ---
+        status=status,
+        availability_date=avail_match.group(1) if avail_match else None,
     )
-    item["availability_date"] = avail_match.group(1) if avail_match else None
 
-    return item
+
+def _absolute_vdp_url(base_url: str, vdp_path: str) -> str:
+    """Resolve a Typesense ``vdpUrl`` against the dealer's *base_url*.
+
+    ``vdpUrl`` is nearly always a root-relative path, which only needs
+    concatenating; anything else goes through ``urljoin``.
+    """
+    if vdp_path[0] == "/" and vdp_path[1:2] != "/":
+        return base_url + vdp_path
+    return urljoin(base_url, vdp_path)
@@ -28,6 +28,7 @@ import re
 from urllib.parse import urljoin, urlparse
 
 import scrapy
+from parsel import css2xpath
 
 from car_inventory_scraper.spiders import log_request_failure
 from scrapy.http import HtmlResponse, JsonResponse
@@ -37,6 +38,7 @@ from car_inventory_scraper.parsing_helpers import (
     normalize_drivetrain,
     normalize_pkg_name,
     parse_price,
+    search_from_marker,
 )
 from car_inventory_scraper.items import CarItem
 
@@ -46,12 +48,37 @@ from car_inventory_scraper.items import CarItem
 # ---------------------------------------------------------------------------
 _ACCOUNT_ID_RE = re.compile(r"var\s+accountId\s*=\s*'(\d+)'")
 
+# CSS selectors, translated to XPath once at import rather than on every
+# ``.css()`` call.
+_TITLE_XPATH = css2xpath("title::text")
+_LEGACY_CARD_XPATH = css2xpath(".standard-inventory")
+_CLEAN_CARD_XPATH = css2xpath(".clean-design-srp-card")
+_CARD_LINK_XPATH = css2xpath(
+    "a.si-vehicle-box::attr(href), "
+    "a.srp-vehicle-box::attr(href), "
+    "a[href*='/viewdetails/']::attr(href)"
+)
+_NEXT_PAGE_XPATH = css2xpath(".inventory-pagination a[rel='next']::attr(href)")
+
+# Downloader slot for the per-VIN Vehicle API requests.
+_API_SLOT = "teamvelocity-api"
+
 
 class TeamVelocitySpider(scrapy.Spider):
     """Scrape vehicle inventory from a Team Velocity-powered dealership site."""
 
     name = "teamvelocity"
 
+    # Each vehicle is one small JSON API call on the dealer's own domain,
+    # so those calls get their own downloader slot with a few in flight
+    # at once.  SRP pages stay on the default slot under the global
+    # one-at-a-time, 2 s-apart politeness settings.
+    custom_settings = {
+        "DOWNLOAD_SLOTS": {
+            _API_SLOT: {"concurrency": 4, "delay": 0.25},
+        },
+    }
+
     # Passed via ``-a url=…`` or the CLI wrapper.
     def __init__(self, url: str | None = None, dealer_name: str | None = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -80,16 +107,14 @@ class TeamVelocitySpider(scrapy.Spider):
         base_url = response.url
         dealer_name = (
             self._dealer_name_override
-            or response.css("title::text").get("").split("|")[-1].strip()
+            or response.xpath(_TITLE_XPATH).get("").split("|")[-1].strip()
         )
 
         # --- Extract accountId from inline JS ---
-        account_id = None
-        for script in response.css("script::text").getall():
-            m = _ACCOUNT_ID_RE.search(script)
-            if m:
-                account_id = m.group(1)
-                break
+        # Search the page text from the first "accountId" rather than
+        # selecting every <script> and running the regex over each one.
+        m = search_from_marker(_ACCOUNT_ID_RE, response.text, "accountId")
+        account_id = m.group(1) if m else None
         if not account_id:
             self.logger.error("[%s] Could not find accountId on %s", self._domain, response.url)
             return
@@ -97,27 +122,23 @@ class TeamVelocitySpider(scrapy.Spider):
         # --- Collect VINs from vehicle cards ---
         # Try the legacy "standard-inventory" class first, then the newer
         # "clean-design-srp-card" layout that Team Velocity rolled out.
-        vehicle_cards = response.css(".standard-inventory")
+        vehicle_cards = response.xpath(_LEGACY_CARD_XPATH)
         if not vehicle_cards:
-            vehicle_cards = response.css(".clean-design-srp-card")
+            vehicle_cards = response.xpath(_CLEAN_CARD_XPATH)
         self.logger.info("[%s] Found %d vehicles on %s", self._domain, len(vehicle_cards), response.url)
 
         for card in vehicle_cards:
             # data-itemid looks like "Toyota-RAV4-SE-JTM6CRAV5TD304101"
             # — the VIN is the last segment.
             data_item = card.attrib.get("data-itemid", "")
-            vin = data_item.rsplit("-", 1)[-1] if data_item else ""
+            vin = data_item[data_item.rfind("-") + 1:]
             if not vin:
                 self.logger.warning("[%s] Could not extract VIN from card with data-itemid=%r", self._domain, data_item)
                 continue
 
             # Build the detail-page URL for the ``detail_url`` field.
-            href = card.css(
-                "a.si-vehicle-box::attr(href), "
-                "a.srp-vehicle-box::attr(href), "
-                "a[href*='/viewdetails/']::attr(href)"
-            ).get("")
-            detail_url = urljoin(base_url, href.split("#")[0]) if href else ""
+            href = card.xpath(_CARD_LINK_XPATH).get("")
+            detail_url = urljoin(base_url, href.partition("#")[0]) if href else ""
 
             api_url = urljoin(
                 base_url,
@@ -131,13 +152,12 @@ class TeamVelocitySpider(scrapy.Spider):
                     "dealer_name": dealer_name,
                     "dealer_url": base_url,
                     "detail_url": detail_url,
+                    "download_slot": _API_SLOT,
                 },
             )
 
         # --- Pagination ---
-        next_page = response.css(
-            ".inventory-pagination a[rel='next']::attr(href)"
-        ).get()
+        next_page = response.xpath(_NEXT_PAGE_XPATH).get()
         if next_page:
             yield scrapy.Request(
                 urljoin(base_url, next_page),
@@ -151,7 +171,8 @@ class TeamVelocitySpider(scrapy.Spider):
 
     async def parse_api(self, response: JsonResponse):
         """Build a CarItem from the ``/api/Inventory/vehicle`` JSON response."""
-        data = json.loads(response.text)
+        # Decode straight from the body bytes, skipping the str decode.
+        data = json.loads(response.body)
 
         item = CarItem()
         item["detail_url"] = response.meta.get("detail_url", "")
@@ -232,19 +253,26 @@ def _parse_oem_packages(raw: str) -> list[dict[str, str | int | None]]:
         entry = entry.strip()
         if not entry:
             continue
-        fields: dict[str, str] = {}
+        # Only two of the fields are used, so pick them out directly
+        # rather than building a dict of every field.  As before, a
+        # repeated key keeps its last value.
+        name = ""
+        msrp = None
         for part in entry.split("~@"):
-            if ":" in part:
-                key, _, value = part.partition(":")
-                fields[key.strip()] = value.strip()
+            key, sep, value = part.partition(":")
+            if not sep:
+                continue
+            key = key.strip()
+            if key == "marketingName":
+                name = value.strip()
+            elif key == "msrp":
+                msrp = value.strip()
 
-        name = fields.get("marketingName", "").strip()
         if not name:
             continue
         name = normalize_pkg_name(name)
 
-        price = parse_price(fields.get("msrp"))
-        packages.append({"name": name, "price": price})
+        packages.append({"name": name, "price": parse_price(msrp)})
 
     return packages
 
@@ -259,22 +287,17 @@ def _status_from_api(data: dict) -> str | None:
     Uses ``reserved``, ``inTransit``, ``inProduction``, and the implicit
     "in stock" state (none of the transit/production flags set).
     """
-    is_reserved = data.get("reserved", False)
-
-    availability = None
     if data.get("inTransit"):
         availability = "In Transit"
     elif data.get("inProduction"):
         availability = "In Production"
-    elif not data.get("inTransit") and not data.get("inProduction"):
+    else:
         # If neither in-transit nor in-production, it's in stock
         # (provided dateInStock is set or we simply infer it).
         availability = "In Stock"
 
-    if is_reserved and availability:
+    if data.get("reserved"):
         return f"Sale Pending - {availability}"
-    if is_reserved:
-        return "Sale Pending"
     return availability
 
 
@@ -293,10 +316,14 @@ def _format_eta(eta: str | None) -> str | None:
     parts = [p.strip() for p in eta.split(" and ")]
     formatted: list[str] = []
     for part in parts:
-        m = re.match(r"(\d{2})/(\d{2})/(\d{4})", part)
-        if m:
-            month, day, year = m.group(1), m.group(2), m.group(3)
-            formatted.append(f"{month}/{day}/{year[2:]}")
+        # Fixed-width ``MM/DD/YYYY`` prefix — checked and sliced directly.
+        if (
+            len(part) >= 10
+            and part[2] == "/"
+            and part[5] == "/"
+            and (part[:2] + part[3:5] + part[6:10]).isdecimal()
+        ):
+            formatted.append(f"{part[:5]}/{part[8:10]}")
         else:
             formatted.append(part)
     return " - ".join(formatted) if formatted else None